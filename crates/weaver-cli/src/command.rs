@@ -135,8 +135,11 @@ impl CommandRequest {
     where
         W: Write,
     {
-        serde_json::to_writer(&mut *writer, self).map_err(AppError::SerialiseRequest)?;
-        writer.write_all(b"\n").map_err(AppError::SendRequest)?;
+        // Encode the whole line up front: the connection is unbuffered, and
+        // `to_writer` would issue a separate write for every JSON token.
+        let mut line = serde_json::to_vec(self).map_err(AppError::SerialiseRequest)?;
+        line.push(b'\n');
+        writer.write_all(&line).map_err(AppError::SendRequest)?;
         writer.flush().map_err(AppError::SendRequest)
     }
 }
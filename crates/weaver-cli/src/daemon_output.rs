@@ -3,7 +3,10 @@
 //! Owns parsing daemon messages and forwarding rendered output to the CLI
 //! streams.
 
-use std::io::{self, Read, Write};
+use std::{
+    borrow::Cow,
+    io::{self, Read, Write},
+};
 
 use serde::Deserialize;
 
@@ -16,6 +19,12 @@ use crate::{
     render_human_output,
 };
 
+/// Capacity of the buffer used to read daemon responses.
+///
+/// Chatty commands stream many small lines, so each read drains a large batch
+/// of them rather than the default 8 KiB at a time.
+const RESPONSE_READ_BUFFER_BYTES: usize = 64 * 1024;
+
 /// Settings for rendering daemon output.
 pub(crate) struct OutputSettings<'a> {
     pub(crate) format: ResolvedOutputFormat,
@@ -24,7 +33,7 @@ pub(crate) struct OutputSettings<'a> {
 
 /// Processes a single daemon message, writing output to the appropriate stream.
 fn process_message<W, E, S>(
-    message: DaemonMessage,
+    message: DaemonMessage<'_>,
     io: &mut IoStreams<'_, S, W, E>,
     settings: &OutputSettings<'_>,
 ) -> Result<(), AppError>
@@ -60,7 +69,11 @@ where
 {
     match stream {
         StreamTarget::Stdout => io.stdout.write_all(payload.as_bytes()),
-        StreamTarget::Stderr => io.stderr.write_all(payload.as_bytes()),
+        // Flush buffered stdout first so the two streams stay in order.
+        StreamTarget::Stderr => io
+            .stdout
+            .flush()
+            .and_then(|()| io.stderr.write_all(payload.as_bytes())),
     }
     .map_err(AppError::ForwardResponse)
 }
@@ -99,17 +112,19 @@ where
 {
     use std::io::BufRead;
 
-    let mut reader = io::BufReader::new(connection);
-    let mut line = String::new();
+    let mut reader = io::BufReader::with_capacity(RESPONSE_READ_BUFFER_BYTES, connection);
+    // Lines are kept as bytes and decoded with `from_slice`, which validates
+    // UTF-8 while parsing instead of in a separate `read_line` pass.
+    let mut line = Vec::new();
     let mut exit_status: Option<i32> = None;
     let mut consecutive_empty_lines = 0;
 
     while reader
-        .read_line(&mut line)
+        .read_until(b'\n', &mut line)
         .map_err(AppError::ReadResponse)?
         != 0
     {
-        if line.trim().is_empty() {
+        if line.trim_ascii().is_empty() {
             consecutive_empty_lines += 1;
             if check_empty_line_limit(consecutive_empty_lines, io)? {
                 break;
@@ -118,12 +133,17 @@ where
             continue;
         }
         consecutive_empty_lines = 0;
-        let message: DaemonMessage = serde_json::from_str(&line).map_err(AppError::ParseMessage)?;
+        let message: DaemonMessage =
+            serde_json::from_slice(&line).map_err(AppError::ParseMessage)?;
         if let DaemonMessage::Exit { status } = &message {
             exit_status = Some(*status);
         }
         process_message(message, io, &settings)?;
         line.clear();
+        // Flush once per batch of buffered responses rather than per line.
+        if reader.buffer().is_empty() {
+            io.stdout.flush().map_err(AppError::ForwardResponse)?;
+        }
     }
 
     io.stdout.flush().map_err(AppError::ForwardResponse)?;
@@ -132,11 +152,21 @@ where
     exit_status.ok_or(AppError::MissingExit)
 }
 
+/// A daemon response line.
+///
+/// Stream payloads borrow from the line buffer and are only copied when the
+/// JSON string contains escapes that must be decoded.
 #[derive(Debug, Deserialize)]
 #[serde(tag = "kind", rename_all = "snake_case")]
-enum DaemonMessage {
-    Stream { stream: StreamTarget, data: String },
-    Exit { status: i32 },
+enum DaemonMessage<'a> {
+    Stream {
+        stream: StreamTarget,
+        #[serde(borrow)]
+        data: Cow<'a, str>,
+    },
+    Exit {
+        status: i32,
+    },
 }
 
 #[derive(Debug, Deserialize)]
@@ -28,18 +28,14 @@ impl KnownDomain {
     }
 
     /// Resolves a raw string to a known domain, case-insensitively.
-    /// Uses DOMAIN_OPERATIONS as the single source of truth.
+    /// Uses DOMAIN_OPERATIONS as the single source of truth and compares in
+    /// place, so lookups do not allocate a lowercased copy of the input.
     pub(crate) fn try_parse(s: &str) -> Option<Self> {
-        let normalized = s.trim().to_ascii_lowercase();
+        let trimmed = s.trim();
         DOMAIN_OPERATIONS
             .iter()
-            .find(|(domain, ..)| *domain == normalized.as_str())
-            .map(|(domain, ..)| match *domain {
-                "observe" => Self::Observe,
-                "act" => Self::Act,
-                "verify" => Self::Verify,
-                _ => panic!("DOMAIN_OPERATIONS contains unknown domain: {domain}"),
-            })
+            .find(|(domain, ..)| domain.eq_ignore_ascii_case(trimmed))
+            .map(|(domain, ..)| known_domain_from_catalogue_entry(domain))
     }
 
     fn operations(self) -> Option<&'static [&'static str]> {
@@ -6,6 +6,7 @@
 //! configuration loading and IO streams can be substituted.
 
 use std::{
+    cell::OnceCell,
     ffi::{OsStr, OsString},
     io::{Read, Write},
     process::ExitCode,
@@ -184,17 +185,21 @@ where
     where
         I: IntoIterator<Item = OsString>,
     {
-        let localizer = build_localizer();
+        // Parsing the Fluent catalogue is only worth paying for when preflight
+        // guidance is written, so the localizer is built on first use.
+        let localizer = OnceCell::new();
         let mut lifecycle = SystemLifecycle;
-        self.run_with_handler(args, localizer.as_ref(), |invocation, context, output| {
-            lifecycle.handle(invocation, context, output)
-        })
+        self.run_with_handler(
+            args,
+            || localizer.get_or_init(build_localizer).as_ref(),
+            |invocation, context, output| lifecycle.handle(invocation, context, output),
+        )
     }
 
-    fn run_with_handler<I, F>(
+    fn run_with_handler<'l, I, F>(
         &mut self,
         args: I,
-        localizer: &dyn Localizer,
+        localizer: impl FnOnce() -> &'l dyn Localizer,
         mut handler: F,
     ) -> ExitCode
     where
@@ -336,7 +341,7 @@ where
 {
     CliRunner::new(io, loader)
         .with_daemon_binary(daemon_binary)
-        .run_with_handler(args, localizer, handler)
+        .run_with_handler(args, || localizer, handler)
 }
 
 #[cfg(test)]
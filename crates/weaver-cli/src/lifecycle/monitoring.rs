@@ -22,10 +22,14 @@ use super::{error::LifecycleError, utils::open_runtime_dir};
 pub(super) const PID_FILENAME: &str = "weaverd.pid";
 /// Filename for the daemon's health snapshot within the runtime directory.
 pub(super) const HEALTH_FILENAME: &str = "weaverd.health";
-/// Interval between health snapshot checks during daemon startup polling.
-/// A 200ms interval balances responsiveness against CPU and filesystem pressure.
-/// [`wait_for_ready`] uses it to poll the daemon's health file.
-const POLL_INTERVAL: Duration = Duration::from_millis(200);
+/// First interval between health snapshot checks during daemon startup polling.
+/// [`next_poll_interval`] doubles the interval after each check, so a daemon
+/// that comes up quickly is noticed within milliseconds.
+pub(super) const INITIAL_POLL_INTERVAL: Duration = Duration::from_millis(5);
+/// Upper bound on the interval between health snapshot checks.
+/// A 200ms cap balances responsiveness against CPU and filesystem pressure for
+/// daemons that take longer to start.
+pub(super) const POLL_INTERVAL: Duration = Duration::from_millis(200);
 
 /// Current operational state of the daemon.
 /// The daemon reports its state through the health snapshot file, transitioning
@@ -126,6 +130,7 @@ pub(super) fn wait_for_ready(
     // the daemon has daemonized to a new PID. Once daemonized, we skip the
     // PID check and rely solely on the timestamp to identify fresh snapshots.
     let mut daemonized = false;
+    let mut interval = INITIAL_POLL_INTERVAL;
     while deadline.is_none_or(|d| Instant::now() < d) {
         poll_spawned_child(child, paths.runtime_dir(), &mut daemonized)?;
         let monitor = ProcessMonitorContext {
@@ -138,7 +143,9 @@ pub(super) fn wait_for_ready(
         {
             return Ok(snapshot);
         }
-        thread::sleep(next_poll_interval(deadline));
+        let remaining = deadline.map(|limit| limit.saturating_duration_since(Instant::now()));
+        thread::sleep(poll_sleep(interval, remaining));
+        interval = next_poll_interval(interval);
     }
     Err(LifecycleError::StartupTimeout {
         health_path: paths.health_path().to_path_buf(),
@@ -182,13 +189,18 @@ fn resolve_health_outcome(
     }
 }
 
-fn next_poll_interval(deadline: Option<Instant>) -> Duration {
-    match deadline {
-        None => POLL_INTERVAL,
-        Some(limit) => limit
-            .checked_duration_since(Instant::now())
-            .map_or(Duration::ZERO, |remaining| remaining.min(POLL_INTERVAL)),
-    }
+/// Returns the interval to use after a check that waited `interval`.
+///
+/// The interval doubles from [`INITIAL_POLL_INTERVAL`] and is capped at
+/// [`POLL_INTERVAL`].
+pub(super) fn next_poll_interval(interval: Duration) -> Duration {
+    interval.saturating_mul(2).min(POLL_INTERVAL)
+}
+
+/// Returns how long to sleep before the next check, never sleeping past the
+/// deadline. `remaining` is `None` when the deadline is unbounded.
+pub(super) fn poll_sleep(interval: Duration, remaining: Option<Duration>) -> Duration {
+    remaining.map_or(interval, |left| left.min(interval))
 }
 
 /// Context for monitoring daemon process startup.
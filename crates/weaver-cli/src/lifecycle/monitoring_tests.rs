@@ -17,8 +17,12 @@ use crate::{
             DaemonStatus,
             HealthCheckOutcome,
             HealthSnapshot,
+            INITIAL_POLL_INTERVAL,
+            POLL_INTERVAL,
             ProcessMonitorContext,
             check_health_snapshot,
+            next_poll_interval,
+            poll_sleep,
             read_health,
             read_pid,
             snapshot_is_recent,
@@ -141,6 +145,36 @@ fn snapshot_is_recent_ignores_subsecond_precision() {
     assert!(snapshot_is_recent(&snapshot, start).expect("valid time"));
 }
 
+#[test]
+fn poll_interval_doubles_up_to_cap() {
+    let intervals: Vec<Duration> = std::iter::successors(Some(INITIAL_POLL_INTERVAL), |interval| {
+        Some(next_poll_interval(*interval))
+    })
+    .take(8)
+    .collect();
+    let expected: Vec<Duration> = [5, 10, 20, 40, 80, 160, 200, 200]
+        .into_iter()
+        .map(Duration::from_millis)
+        .collect();
+
+    assert_eq!(intervals, expected);
+    assert_eq!(next_poll_interval(POLL_INTERVAL), POLL_INTERVAL);
+}
+
+#[rstest]
+#[case::unbounded(None, 80)]
+#[case::ample_time(Some(500), 80)]
+#[case::clamped_to_deadline(Some(30), 30)]
+#[case::deadline_passed(Some(0), 0)]
+fn poll_sleep_is_clamped_to_deadline(#[case] remaining_ms: Option<u64>, #[case] expected_ms: u64) {
+    let remaining = remaining_ms.map(Duration::from_millis);
+
+    assert_eq!(
+        poll_sleep(Duration::from_millis(80), remaining),
+        Duration::from_millis(expected_ms)
+    );
+}
+
 #[rstest]
 fn check_health_snapshot_returns_continue_when_missing(temp_paths: (TempDir, RuntimePaths)) {
     let (_dir, paths) = temp_paths;
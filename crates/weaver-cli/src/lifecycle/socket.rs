@@ -57,6 +57,11 @@ fn resolve_tcp(host: &str, port: u16) -> io::Result<SocketAddr> {
 
 #[cfg(unix)]
 fn connect_unix(path: &str) -> io::Result<()> {
+    // A missing socket file is the common "not running" case; answer it with a
+    // single `stat` instead of creating and connecting a socket.
+    if !std::path::Path::new(path).try_exists()? {
+        return Err(io::ErrorKind::NotFound.into());
+    }
     let socket = Socket::new(Domain::UNIX, Type::STREAM, None)?;
     let address = SockAddr::unix(path)?;
     socket.connect_timeout(&address, SOCKET_PROBE_TIMEOUT)
@@ -96,35 +101,47 @@ fn is_socket_available(error: &io::Error) -> bool {
 mod tests {
     //! Unit tests for socket endpoint reachability and connection handling.
 
-    use std::{net::TcpListener, thread};
+    use std::{net::TcpListener, thread, time::Instant};
 
     use rstest::rstest;
 
     use super::*;
 
+    /// Polls until the endpoint refuses connections, instead of sleeping for a
+    /// fixed interval after the listener closes.
+    fn wait_until_unreachable(endpoint: &SocketEndpoint) -> Result<(), String> {
+        let deadline = Instant::now() + Duration::from_secs(2);
+        while Instant::now() < deadline {
+            if !socket_is_reachable(endpoint).map_err(|error| format!("probe endpoint: {error}"))? {
+                return Ok(());
+            }
+            thread::sleep(Duration::from_millis(5));
+        }
+        Err(String::from("closed listener should stop accepting"))
+    }
+
     #[test]
-    fn socket_reachability_tracks_tcp_listener() {
+    fn socket_reachability_tracks_tcp_listener() -> Result<(), String> {
         let listener = TcpListener::bind(("127.0.0.1", 0)).expect("bind listener");
         let addr = listener.local_addr().expect("local addr");
         let endpoint = SocketEndpoint::tcp(addr.ip().to_string(), addr.port());
         assert!(socket_is_reachable(&endpoint).expect("probe reachable"));
         drop(listener);
-        // Allow time for the socket to transition out of TIME_WAIT state.
-        thread::sleep(Duration::from_millis(50));
-        assert!(!socket_is_reachable(&endpoint).expect("probe available"));
+        wait_until_unreachable(&endpoint)?;
+        Ok(())
     }
 
     #[test]
-    fn ensure_socket_available_rejects_bound_socket() {
+    fn ensure_socket_available_rejects_bound_socket() -> Result<(), String> {
         let listener = TcpListener::bind(("127.0.0.1", 0)).expect("bind listener");
         let addr = listener.local_addr().expect("local addr");
         let endpoint = SocketEndpoint::tcp(addr.ip().to_string(), addr.port());
         let error = ensure_socket_available(&endpoint).expect_err("socket should be reported busy");
         assert!(matches!(error, LifecycleError::SocketInUse { .. }));
         drop(listener);
-        // Allow time for the socket to transition out of TIME_WAIT state.
-        thread::sleep(Duration::from_millis(50));
+        wait_until_unreachable(&endpoint)?;
         ensure_socket_available(&endpoint).expect("socket becomes available");
+        Ok(())
     }
 
     /// Tests that is_socket_available correctly classifies error kinds indicating
@@ -155,7 +172,19 @@ mod tests {
 
     #[cfg(unix)]
     #[test]
-    fn unix_socket_reachability_tracks_listener() {
+    fn missing_unix_socket_is_available() {
+        use tempfile::TempDir;
+
+        let dir = TempDir::new().expect("create temp dir");
+        let socket_path = dir.path().join("missing.sock");
+        let endpoint = SocketEndpoint::unix(socket_path.to_str().expect("path to str").to_string());
+
+        assert!(!socket_is_reachable(&endpoint).expect("probe missing socket"));
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn unix_socket_reachability_tracks_listener() -> Result<(), String> {
         use std::os::unix::net::UnixListener;
 
         use tempfile::TempDir;
@@ -167,7 +196,7 @@ mod tests {
 
         assert!(socket_is_reachable(&endpoint).expect("probe reachable"));
         drop(listener);
-        thread::sleep(Duration::from_millis(50));
-        assert!(!socket_is_reachable(&endpoint).expect("probe available"));
+        wait_until_unreachable(&endpoint)?;
+        Ok(())
     }
 }
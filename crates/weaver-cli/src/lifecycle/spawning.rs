@@ -22,13 +22,11 @@ pub(super) fn spawn_daemon(
 ) -> Result<Child, LifecycleError> {
     let binary = resolve_daemon_binary(binary_override);
     let mut command = Command::new(&binary);
-    if config_arguments.len() > 1 {
-        // Skip argv[0], which is the binary name, and forward the remaining CLI
-        // arguments verbatim to the daemon.
-        for arg in &config_arguments[1..] {
-            command.arg(arg);
-        }
-    }
+    // Skip argv[0], which is the binary name, and forward the remaining CLI
+    // arguments verbatim to the daemon.
+    command.args(config_arguments.iter().skip(1));
+    // Keep the command free of `pre_exec` hooks and credential changes so the
+    // standard library can launch it with `posix_spawn` rather than `fork`.
     command.stdout(Stdio::inherit()).stderr(Stdio::inherit());
     command
         .spawn()
@@ -5,16 +5,27 @@
 //! JSONL requests to the configured daemon transport.
 
 use std::{
-    io::{self, IsTerminal, StderrLock, StdinLock, StdoutLock},
+    io::{self, BufWriter, IsTerminal, StderrLock, StdinLock, StdoutLock, Write},
     process::ExitCode,
 };
 
 fn main() -> ExitCode {
     let stdout_is_terminal = io::stdout().is_terminal();
     let mut stdin: StdinLock<'_> = io::stdin().lock();
-    let mut stdout: StdoutLock<'_> = io::stdout().lock();
+    // The standard stdout handle flushes on every newline; buffer it so
+    // streamed daemon output is written in batches instead.
+    let mut stdout: BufWriter<StdoutLock<'_>> = BufWriter::new(io::stdout().lock());
     let mut stderr: StderrLock<'_> = io::stderr().lock();
     let mut io =
         weaver_cli::IoStreams::new(&mut stdin, &mut stdout, &mut stderr, stdout_is_terminal);
-    weaver_cli::run(std::env::args_os(), &mut io)
+    let exit_code = weaver_cli::run(std::env::args_os(), &mut io);
+    // Output still buffered here has not reached stdout yet, so a failed flush
+    // must fail the command rather than lose its tail silently.
+    if let Err(error) = stdout.flush() {
+        writeln!(stderr, "failed to flush standard output: {error}").ok();
+        if exit_code == ExitCode::SUCCESS {
+            return ExitCode::FAILURE;
+        }
+    }
+    exit_code
 }
@@ -6,6 +6,7 @@
 
 mod models;
 mod render;
+mod route;
 mod source;
 
 use weaver_daemon_types::UnknownOperationDetails;
@@ -17,7 +18,6 @@ use crate::output::{
     models::{
         CapabilityResolution,
         DefinitionLocation,
-        DiagnosticItem,
         DiagnosticsResponse,
         ReferenceResponse,
         VerificationFailure,
@@ -26,7 +26,15 @@ use crate::output::{
         parse_unknown_operation,
         parse_verification_failures,
     },
-    source::{SourceLocation, SourcePosition, extract_uri_argument, from_path_or_uri, from_uri},
+    route::HumanRoute,
+    source::{
+        SourceLocation,
+        SourcePosition,
+        UriResolver,
+        diagnostic_location,
+        extract_uri_argument,
+        from_path_or_uri,
+    },
 };
 
 /// Output format after resolving `auto` based on TTY detection.
@@ -94,25 +102,26 @@ pub fn render_human_output(context: &OutputContext, data: &str) -> Option<String
         return None;
     }
 
-    if let Some(unknown_operation) = parse_unknown_operation(trimmed) {
+    let kind = models::payload_kind(trimmed);
+    if kind == models::PayloadKind::UnknownOperation
+        && let Some(unknown_operation) = parse_unknown_operation(trimmed)
+    {
         return Some(render_unknown_operation(unknown_operation.details));
     }
 
-    let domain = context.domain.to_ascii_lowercase();
-    let operation = context.operation.to_ascii_lowercase();
-
-    match (domain.as_str(), operation.as_str()) {
-        ("observe", "get-definition") => parse_definitions(trimmed).map(render_definitions),
-        ("observe", "find-references") => serde_json::from_str::<ReferenceResponse>(trimmed)
+    match HumanRoute::for_context(context) {
+        HumanRoute::Definitions => parse_definitions(trimmed).map(render_definitions),
+        HumanRoute::References => serde_json::from_str::<ReferenceResponse>(trimmed)
             .ok()
             .map(render_references),
-        ("verify", "diagnostics") => serde_json::from_str::<DiagnosticsResponse>(trimmed)
+        HumanRoute::Diagnostics => serde_json::from_str::<DiagnosticsResponse>(trimmed)
             .ok()
             .map(|response| render_diagnostics(response, context)),
-        ("act", _) => parse_capability_resolution(trimmed)
-            .map(render_capability_resolution)
-            .or_else(|| parse_verification_failures(trimmed).map(render_verification_failures)),
-        _ => None,
+        HumanRoute::Act if kind == models::PayloadKind::CapabilityResolution => {
+            parse_capability_resolution(trimmed).map(render_capability_resolution)
+        }
+        HumanRoute::Act => parse_verification_failures(trimmed).map(render_verification_failures),
+        HumanRoute::Raw => None,
     }
 }
 
@@ -140,11 +149,12 @@ where
     if items.is_empty() {
         return String::from(options.empty_message);
     }
+    let mut resolver = UriResolver::default();
     let locations: Vec<SourceLocation> = items
         .into_iter()
         .map(|item| {
             let uri = (accessors.uri)(&item);
-            from_uri(
+            resolver.location(
                 &uri,
                 Some((accessors.line)(&item)),
                 Some((accessors.column)(&item)),
@@ -195,10 +205,11 @@ fn render_diagnostics(response: DiagnosticsResponse, context: &OutputContext) ->
         return String::from("no diagnostics reported\n");
     }
     let fallback_uri = extract_uri_argument(&context.arguments);
+    let mut resolver = UriResolver::default();
     let locations: Vec<SourceLocation> = response
         .diagnostics
         .into_iter()
-        .map(|diagnostic| diagnostic_to_location(diagnostic, fallback_uri.as_deref()))
+        .map(|diagnostic| diagnostic_location(diagnostic, fallback_uri.as_deref(), &mut resolver))
         .collect();
     render::render_locations(&locations)
 }
@@ -264,28 +275,6 @@ fn render_unknown_operation(details: UnknownOperationDetails) -> String {
     rendered
 }
 
-fn diagnostic_to_location(
-    diagnostic: DiagnosticItem,
-    fallback_uri: Option<&str>,
-) -> SourceLocation {
-    let label = if diagnostic.message.is_empty() {
-        String::from("diagnostic")
-    } else {
-        diagnostic.message
-    };
-
-    if let Some(uri) = diagnostic.uri.as_deref().or(fallback_uri) {
-        from_uri(uri, Some(diagnostic.line), Some(diagnostic.column), label)
-    } else {
-        SourceLocation::unresolved(
-            String::from("<unknown source>"),
-            SourcePosition::new(Some(diagnostic.line), Some(diagnostic.column)),
-            label,
-            String::from("missing URI for diagnostic"),
-        )
-    }
-}
-
 fn verification_failure_to_location(failure: VerificationFailure) -> SourceLocation {
     let label = if let Some(phase) = failure.phase.as_deref() {
         format!("{phase}: {}", failure.message)
@@ -305,93 +294,4 @@ fn verification_failure_to_location(failure: VerificationFailure) -> SourceLocat
 }
 
 #[cfg(test)]
-mod tests {
-    //! Unit tests for output format resolution and stream handling.
-
-    use rstest::rstest;
-
-    use super::*;
-
-    #[rstest]
-    #[case(OutputFormat::Auto, true, ResolvedOutputFormat::Human)]
-    #[case(OutputFormat::Auto, false, ResolvedOutputFormat::Json)]
-    #[case(OutputFormat::Human, true, ResolvedOutputFormat::Human)]
-    #[case(OutputFormat::Human, false, ResolvedOutputFormat::Human)]
-    #[case(OutputFormat::Json, true, ResolvedOutputFormat::Json)]
-    #[case(OutputFormat::Json, false, ResolvedOutputFormat::Json)]
-    fn resolves_output_format(
-        #[case] format: OutputFormat,
-        #[case] stdout_is_terminal: bool,
-        #[case] expected: ResolvedOutputFormat,
-    ) {
-        assert_eq!(format.resolve(stdout_is_terminal), expected);
-    }
-
-    #[test]
-    fn renders_capability_resolution_for_humans() {
-        let payload = r#"{
-  "status": "ok",
-  "type": "CapabilityResolution",
-  "details": {
-    "capability": "rename-symbol",
-    "language": "python",
-    "selected_provider": "rope",
-    "selection_mode": "automatic",
-    "outcome": "selected",
-    "candidates": [
-      {"provider": "rope", "accepted": true, "reason": "matched_language_and_capability"},
-      {"provider": "rust-analyzer", "accepted": false, "reason": "unsupported_language"}
-    ]
-  }
-}"#;
-        let context = OutputContext::new("act", "refactor", Vec::new());
-
-        let rendered = render_human_output(&context, payload).expect("rendered");
-
-        assert!(rendered.contains("rename-symbol automatic for python: selected rope"));
-        assert!(rendered.contains("candidate accepted: rope"));
-        assert!(rendered.contains("candidate rejected: rust-analyzer"));
-    }
-
-    #[test]
-    fn ignores_non_capability_json_in_capability_renderer() {
-        let context = OutputContext::new("act", "refactor", Vec::new());
-
-        let rendered = render_human_output(
-            &context,
-            r#"{"status":"error","type":"VerificationError","details":{"failures":[]}}"#,
-        )
-        .expect("rendered");
-
-        assert_eq!(rendered, "no verification failures reported\n");
-    }
-
-    #[test]
-    fn renders_unknown_operation_payload_for_humans() {
-        let context = OutputContext::new("observe", "nonexistent", Vec::new());
-        let payload = serde_json::to_string(&serde_json::json!({
-            "status": "error",
-            "type": UNKNOWN_OPERATION_TYPE,
-            "details": {
-                "domain": "observe",
-                "operation": "nonexistent",
-                "known_operations": [
-                    "get-definition",
-                    "find-references",
-                    "grep",
-                    "diagnostics",
-                    "call-hierarchy",
-                    "get-card"
-                ]
-            }
-        }))
-        .expect("unknown-operation payload");
-
-        let rendered = render_human_output(&context, &payload).expect("rendered");
-
-        assert!(rendered.contains("error: unknown operation 'nonexistent' for domain 'observe'"));
-        assert!(rendered.contains("Available operations:"));
-        assert!(rendered.contains("get-definition"));
-        assert!(rendered.contains("get-card"));
-    }
-}
+mod tests;
@@ -126,6 +126,38 @@ pub(crate) struct CapabilityCandidate {
     pub(crate) reason: String,
 }
 
+/// Envelope discriminator for the object payloads the renderer recognizes.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) enum PayloadKind {
+    /// An unknown-operation error envelope.
+    UnknownOperation,
+    /// A capability-resolution envelope.
+    CapabilityResolution,
+    /// Any other payload, including non-object JSON and untyped objects.
+    Other,
+}
+
+#[derive(Debug, Deserialize)]
+struct PayloadTag {
+    #[serde(rename = "type")]
+    kind: Option<String>,
+}
+
+/// Classifies a payload by its `type` field, rejecting untagged payloads with a
+/// substring scan and skipping every other field rather than deserializing it.
+#[must_use]
+pub(crate) fn payload_kind(payload: &str) -> PayloadKind {
+    let typed = payload.contains(r#""type""#);
+    let tag = typed
+        .then(|| serde_json::from_str::<PayloadTag>(payload).ok())
+        .flatten();
+    match tag.and_then(|tag| tag.kind).as_deref() {
+        Some(UNKNOWN_OPERATION_TYPE) => PayloadKind::UnknownOperation,
+        Some(CAPABILITY_RESOLUTION_TYPE) => PayloadKind::CapabilityResolution,
+        _ => PayloadKind::Other,
+    }
+}
+
 /// Parses definition locations from a JSON payload.
 #[must_use]
 pub(crate) fn parse_definitions(payload: &str) -> Option<Vec<DefinitionLocation>> {
@@ -222,6 +254,26 @@ mod tests {
 
     use super::*;
 
+    #[rstest::rstest]
+    #[case::unknown_operation(
+        r#"{"type":"UnknownOperation","details":{}}"#,
+        PayloadKind::UnknownOperation
+    )]
+    #[case::capability(
+        r#"{"status":"ok","type":"CapabilityResolution"}"#,
+        PayloadKind::CapabilityResolution
+    )]
+    #[case::verification(r#"{"type":"VerificationError"}"#, PayloadKind::Other)]
+    #[case::untyped_object(r#"{"references":[]}"#, PayloadKind::Other)]
+    #[case::array(
+        r#"[{"uri":"file:///tmp/test.rs","line":3,"column":5}]"#,
+        PayloadKind::Other
+    )]
+    #[case::not_json("plain text", PayloadKind::Other)]
+    fn classifies_payload_kind(#[case] payload: &str, #[case] expected: PayloadKind) {
+        assert_eq!(payload_kind(payload), expected);
+    }
+
     #[test]
     fn parses_definition_locations() {
         let payload = r#"[{"uri":"file:///tmp/test.rs","line":3,"column":5}]"#;
@@ -68,22 +68,28 @@ fn render_group(output: &mut String, key: &str, group: &[&SourceLocation]) {
     let content_result = source
         .as_path()
         .map(|path| read_source_content(path).map_err(|err| err.to_string()));
+    // Split the file once; every location in the group indexes the same lines.
+    let lines_result = content_result.as_ref().map(|result| {
+        result
+            .as_ref()
+            .map(|content| content.lines().collect::<Vec<_>>())
+    });
 
     for (index, location) in group.iter().enumerate() {
         if index > 0 {
             output.push('\n');
         }
-        render_single_location(output, location, content_result.as_ref());
+        render_single_location(output, location, lines_result.as_ref());
     }
 }
 
 fn render_single_location(
     output: &mut String,
     location: &SourceLocation,
-    content_result: Option<&Result<String, String>>,
+    lines_result: Option<&Result<Vec<&str>, &String>>,
 ) {
-    match content_result {
-        Some(Ok(content)) => render_location_block(output, location, Some(content)),
+    match lines_result {
+        Some(Ok(lines)) => render_location_block(output, location, Some(lines.as_slice())),
         Some(Err(error)) => {
             render_unresolved(output, location, format!("source unavailable: {error}"));
         }
@@ -91,7 +97,7 @@ fn render_single_location(
     }
 }
 
-fn render_location_block(output: &mut String, location: &SourceLocation, content: Option<&str>) {
+fn render_location_block(output: &mut String, location: &SourceLocation, lines: Option<&[&str]>) {
     let line = location.position.line;
     let column = location.position.column;
 
@@ -100,7 +106,7 @@ fn render_location_block(output: &mut String, location: &SourceLocation, content
         return;
     }
 
-    let Some(content) = content else {
+    let Some(lines) = lines else {
         render_unresolved(output, location, String::from("source unavailable"));
         return;
     };
@@ -111,7 +117,7 @@ fn render_location_block(output: &mut String, location: &SourceLocation, content
     };
 
     let column = column.unwrap_or(1);
-    render_context(output, location, content, LineColumn { line, column });
+    render_context(output, location, lines, LineColumn { line, column });
 }
 
 fn render_unresolved(output: &mut String, location: &SourceLocation, reason: impl Into<String>) {
@@ -133,10 +139,9 @@ fn render_unresolved(output: &mut String, location: &SourceLocation, reason: imp
 fn render_context(
     output: &mut String,
     location: &SourceLocation,
-    content: &str,
+    lines: &[&str],
     point: LineColumn,
 ) {
-    let lines: Vec<&str> = content.lines().collect();
     if lines.is_empty() {
         render_unresolved(output, location, String::from("source is empty"));
         return;
@@ -261,7 +266,7 @@ mod tests {
             render_context(
                 &mut buffer,
                 &location,
-                content,
+                &content.lines().collect::<Vec<_>>(),
                 LineColumn { line: 2, column: 5 },
             );
             buffer
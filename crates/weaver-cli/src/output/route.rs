@@ -0,0 +1,69 @@
+//! Selection of the human renderer for a command's responses.
+//!
+//! Domains and operations are compared case-insensitively in place, so
+//! choosing a renderer does not allocate lowercase copies for every streamed
+//! payload.
+
+use super::OutputContext;
+
+/// Renderer family chosen from the command domain and operation.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub(super) enum HumanRoute {
+    /// `observe get-definition` location lists.
+    Definitions,
+    /// `observe find-references` reference envelopes.
+    References,
+    /// `verify diagnostics` diagnostic envelopes.
+    Diagnostics,
+    /// Any `act` operation: capability resolutions or verification failures.
+    Act,
+    /// Payloads without a dedicated human renderer.
+    Raw,
+}
+
+impl HumanRoute {
+    /// Selects the renderer for `context`, ignoring ASCII case.
+    pub(super) fn for_context(context: &OutputContext) -> Self {
+        let targets = |domain: &str, operation: &str| {
+            context.domain.eq_ignore_ascii_case(domain)
+                && context.operation.eq_ignore_ascii_case(operation)
+        };
+        if targets("observe", "get-definition") {
+            Self::Definitions
+        } else if targets("observe", "find-references") {
+            Self::References
+        } else if targets("verify", "diagnostics") {
+            Self::Diagnostics
+        } else if context.domain.eq_ignore_ascii_case("act") {
+            Self::Act
+        } else {
+            Self::Raw
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    //! Unit tests for human renderer selection.
+
+    use rstest::rstest;
+
+    use super::*;
+
+    #[rstest]
+    #[case::definitions("observe", "get-definition", HumanRoute::Definitions)]
+    #[case::mixed_case("Observe", "GET-Definition", HumanRoute::Definitions)]
+    #[case::references("observe", "find-references", HumanRoute::References)]
+    #[case::diagnostics("VERIFY", "diagnostics", HumanRoute::Diagnostics)]
+    #[case::act("act", "refactor", HumanRoute::Act)]
+    #[case::unknown_operation("observe", "nonexistent", HumanRoute::Raw)]
+    #[case::unknown_domain("story", "get-definition", HumanRoute::Raw)]
+    fn selects_route_case_insensitively(
+        #[case] domain: &str,
+        #[case] operation: &str,
+        #[case] expected: HumanRoute,
+    ) {
+        let context = OutputContext::new(domain, operation, Vec::new());
+        assert_eq!(HumanRoute::for_context(&context), expected);
+    }
+}
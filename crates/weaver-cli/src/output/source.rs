@@ -1,9 +1,14 @@
 //! Source resolution helpers for human-readable output.
 
-use std::path::{Path, PathBuf};
+use std::{
+    collections::HashMap,
+    path::{Path, PathBuf},
+};
 
 use url::Url;
 
+use super::models::DiagnosticItem;
+
 /// A resolved or unresolved source location.
 #[derive(Debug, Clone)]
 pub(crate) struct SourceLocation {
@@ -72,6 +77,58 @@ impl SourcePosition {
     }
 }
 
+/// Resolves location URIs, parsing each distinct URI only once.
+///
+/// Location lists usually repeat a handful of files many times, so renderers
+/// share one resolver across every location in a payload.
+#[derive(Debug, Default)]
+pub(crate) struct UriResolver {
+    resolved: HashMap<String, Result<PathBuf, String>>,
+}
+
+impl UriResolver {
+    /// Creates a source location from a URI string.
+    pub(crate) fn location(
+        &mut self,
+        uri: &str,
+        line: Option<u32>,
+        column: Option<u32>,
+        label: impl Into<String>,
+    ) -> SourceLocation {
+        let resolved = self.resolved.get(uri).cloned().unwrap_or_else(|| {
+            let resolved = resolve_uri(uri);
+            self.resolved.insert(uri.to_owned(), resolved.clone());
+            resolved
+        });
+        location_from(resolved, uri, line, column, label)
+    }
+}
+
+/// Creates a source location for a diagnostic, falling back to the URI the
+/// command targeted when the diagnostic omits its own.
+pub(crate) fn diagnostic_location(
+    diagnostic: DiagnosticItem,
+    fallback_uri: Option<&str>,
+    resolver: &mut UriResolver,
+) -> SourceLocation {
+    let label = if diagnostic.message.is_empty() {
+        String::from("diagnostic")
+    } else {
+        diagnostic.message
+    };
+
+    if let Some(uri) = diagnostic.uri.as_deref().or(fallback_uri) {
+        resolver.location(uri, Some(diagnostic.line), Some(diagnostic.column), label)
+    } else {
+        SourceLocation::unresolved(
+            String::from("<unknown source>"),
+            SourcePosition::new(Some(diagnostic.line), Some(diagnostic.column)),
+            label,
+            String::from("missing URI for diagnostic"),
+        )
+    }
+}
+
 /// Creates a source location from a URI string.
 #[must_use]
 pub(crate) fn from_uri(
@@ -80,7 +137,17 @@ pub(crate) fn from_uri(
     column: Option<u32>,
     label: impl Into<String>,
 ) -> SourceLocation {
-    match resolve_uri(uri) {
+    location_from(resolve_uri(uri), uri, line, column, label)
+}
+
+fn location_from(
+    resolved: Result<PathBuf, String>,
+    uri: &str,
+    line: Option<u32>,
+    column: Option<u32>,
+    label: impl Into<String>,
+) -> SourceLocation {
+    match resolved {
         Ok(path) => SourceLocation {
             source: SourceReference::Path(path),
             position: SourcePosition::new(line, column),
@@ -160,6 +227,19 @@ mod tests {
         );
     }
 
+    #[test]
+    fn resolver_parses_each_uri_once() {
+        let mut resolver = UriResolver::default();
+        let first = resolver.location("file:///tmp/test.rs", Some(1), Some(1), "first");
+        let second = resolver.location("file:///tmp/test.rs", Some(2), Some(1), "second");
+        let invalid = resolver.location("not a uri", Some(3), None, "third");
+
+        assert_eq!(resolver.resolved.len(), 2);
+        assert_eq!(first.source.as_path(), Some(Path::new("/tmp/test.rs")));
+        assert_eq!(second.source.as_path(), first.source.as_path());
+        assert!(invalid.source.reason().is_some());
+    }
+
     #[test]
     fn handles_inline_uri_argument() {
         let args = vec![String::from("--uri=file:///tmp/test.rs")];
@@ -0,0 +1,142 @@
+//! Unit tests for output format resolution and human rendering.
+
+use rstest::rstest;
+
+use super::*;
+
+#[rstest]
+#[case(OutputFormat::Auto, true, ResolvedOutputFormat::Human)]
+#[case(OutputFormat::Auto, false, ResolvedOutputFormat::Json)]
+#[case(OutputFormat::Human, true, ResolvedOutputFormat::Human)]
+#[case(OutputFormat::Human, false, ResolvedOutputFormat::Human)]
+#[case(OutputFormat::Json, true, ResolvedOutputFormat::Json)]
+#[case(OutputFormat::Json, false, ResolvedOutputFormat::Json)]
+fn resolves_output_format(
+    #[case] format: OutputFormat,
+    #[case] stdout_is_terminal: bool,
+    #[case] expected: ResolvedOutputFormat,
+) {
+    assert_eq!(format.resolve(stdout_is_terminal), expected);
+}
+
+#[test]
+fn renders_capability_resolution_for_humans() {
+    let payload = r#"{
+  "status": "ok",
+  "type": "CapabilityResolution",
+  "details": {
+"capability": "rename-symbol",
+"language": "python",
+"selected_provider": "rope",
+"selection_mode": "automatic",
+"outcome": "selected",
+"candidates": [
+  {"provider": "rope", "accepted": true, "reason": "matched_language_and_capability"},
+  {"provider": "rust-analyzer", "accepted": false, "reason": "unsupported_language"}
+]
+  }
+}"#;
+    let context = OutputContext::new("act", "refactor", Vec::new());
+
+    let rendered = render_human_output(&context, payload).expect("rendered");
+
+    assert!(rendered.contains("rename-symbol automatic for python: selected rope"));
+    assert!(rendered.contains("candidate accepted: rope"));
+    assert!(rendered.contains("candidate rejected: rust-analyzer"));
+}
+
+#[test]
+fn ignores_non_capability_json_in_capability_renderer() {
+    let context = OutputContext::new("act", "refactor", Vec::new());
+
+    let rendered = render_human_output(
+        &context,
+        r#"{"status":"error","type":"VerificationError","details":{"failures":[]}}"#,
+    )
+    .expect("rendered");
+
+    assert_eq!(rendered, "no verification failures reported\n");
+}
+
+#[test]
+fn renders_unknown_operation_payload_for_humans() {
+    let context = OutputContext::new("observe", "nonexistent", Vec::new());
+    let payload = serde_json::to_string(&serde_json::json!({
+        "status": "error",
+        "type": UNKNOWN_OPERATION_TYPE,
+        "details": {
+            "domain": "observe",
+            "operation": "nonexistent",
+            "known_operations": [
+                "get-definition",
+                "find-references",
+                "grep",
+                "diagnostics",
+                "call-hierarchy",
+                "get-card"
+            ]
+        }
+    }))
+    .expect("unknown-operation payload");
+
+    let rendered = render_human_output(&context, &payload).expect("rendered");
+
+    assert!(rendered.contains("error: unknown operation 'nonexistent' for domain 'observe'"));
+    assert!(rendered.contains("Available operations:"));
+    assert!(rendered.contains("get-definition"));
+    assert!(rendered.contains("get-card"));
+}
+
+#[rstest]
+#[case::capability_under_act(
+    ("act", "refactor"),
+    r#"{"status":"ok","type":"CapabilityResolution","details":{"capability":"rename-symbol","selection_mode":"automatic","outcome":"refused"}}"#,
+    Some("rename-symbol automatic for unknown: refused (refused)")
+)]
+#[case::malformed_capability_under_act(
+    ("act", "refactor"),
+    r#"{"status":"ok","type":"CapabilityResolution","details":{"failures":[]}}"#,
+    None
+)]
+#[case::untyped_verification_under_act(
+    ("act", "apply-patch"),
+    r#"{"status":"error","details":{"failures":[]}}"#,
+    Some("no verification failures reported")
+)]
+#[case::unknown_operation_under_act(
+    ("act", "bogus"),
+    r#"{"status":"error","type":"UnknownOperation","details":{"domain":"act","operation":"bogus","known_operations":[]}}"#,
+    Some("error: unknown operation 'bogus' for domain 'act'")
+)]
+#[case::unknown_operation_under_observe(
+    ("observe", "get-definition"),
+    r#"{"status":"error","type":"UnknownOperation","details":{"domain":"observe","operation":"bogus","known_operations":[]}}"#,
+    Some("error: unknown operation 'bogus' for domain 'observe'")
+)]
+#[case::malformed_unknown_operation_under_act(
+    ("act", "bogus"),
+    r#"{"status":"error","type":"UnknownOperation","details":{"failures":[]}}"#,
+    None
+)]
+#[case::capability_under_observe(
+    ("observe", "get-definition"),
+    r#"{"status":"ok","type":"CapabilityResolution","details":{"capability":"rename-symbol","selection_mode":"automatic","outcome":"refused"}}"#,
+    None
+)]
+fn routes_human_output_by_payload_kind(
+    #[case] (domain, operation): (&str, &str),
+    #[case] payload: &str,
+    #[case] expected: Option<&str>,
+) {
+    let context = OutputContext::new(domain, operation, Vec::new());
+
+    let rendered = render_human_output(&context, payload);
+
+    match expected {
+        Some(fragment) => {
+            let text = rendered.expect("rendered");
+            assert!(text.contains(fragment), "unexpected rendering: {text}");
+        }
+        None => assert!(rendered.is_none(), "unexpected rendering: {rendered:?}"),
+    }
+}
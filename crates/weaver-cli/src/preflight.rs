@@ -25,37 +25,40 @@ enum DomainGuidanceToEmit {
 /// Handles preflight exits after argv splitting and before configuration
 /// loading, returning `Ok(())` when no early exit is needed or an [`AppError`]
 /// that exits before daemon startup.
-pub(crate) fn handle_preflight<ErrWriter: Write>(
+///
+/// The `localizer` closure is only invoked when guidance is written, so
+/// callers can defer building the Fluent catalogue until it is needed.
+pub(crate) fn handle_preflight<'l, ErrWriter: Write>(
     cli: &Cli,
     stderr: &mut ErrWriter,
-    localizer: &dyn Localizer,
+    localizer: impl FnOnce() -> &'l dyn Localizer,
 ) -> Result<(), AppError> {
     if cli.is_bare_invocation() {
         tracing::debug!("emitting bare invocation guidance");
-        actionable_guidance::write_bare_invocation_guidance(stderr, localizer)
+        actionable_guidance::write_bare_invocation_guidance(stderr, localizer())
             .map_err(AppError::EmitBareHelp)?;
         return Err(AppError::BareInvocation);
     }
     if should_emit_domain_guidance(cli) {
-        let raw_domain = cli.domain.as_deref().map(str::trim).unwrap_or_default();
+        let raw_domain = raw_domain(cli);
         tracing::debug!(domain = raw_domain, "evaluating preflight domain guidance");
-        emit_domain_guidance(cli, stderr, localizer, raw_domain)?;
+        if let Some(guidance) = domain_guidance(cli, raw_domain) {
+            emit_domain_guidance(guidance, stderr, localizer(), raw_domain)?;
+        }
     }
     Ok(())
 }
 
+fn raw_domain(cli: &Cli) -> &str { cli.domain.as_deref().map(str::trim).unwrap_or_default() }
+
 /// Dispatches domain-specific guidance to stderr for unknown domains or missing
 /// operations.
 fn emit_domain_guidance<ErrWriter: Write>(
-    cli: &Cli,
+    guidance: DomainGuidanceToEmit,
     stderr: &mut ErrWriter,
     localizer: &dyn Localizer,
     raw_domain: &str,
 ) -> Result<(), AppError> {
-    let Some(guidance) = domain_guidance(cli, raw_domain) else {
-        return Ok(());
-    };
-
     let written = match guidance {
         DomainGuidanceToEmit::MissingOperation(domain) => {
             tracing::debug!(?domain, "emitting missing operation guidance");
@@ -104,7 +107,7 @@ fn preflight_result(written: bool) -> Result<(), AppError> {
 mod tests {
     //! Tests for preflight guidance decisions and write-error propagation.
 
-    use std::{io, io::Write};
+    use std::{cell::Cell, io, io::Write};
 
     use ortho_config::{FluentLocalizer, Localizer};
     use rstest::{fixture, rstest};
@@ -224,7 +227,7 @@ mod tests {
         let result = handle_preflight(
             &cli(scenario.domain, scenario.operation),
             &mut stderr,
-            localizer.as_ref(),
+            || localizer.as_ref(),
         );
 
         match scenario.expected_result {
@@ -258,7 +261,7 @@ mod tests {
         let result = handle_preflight(
             &cli(scenario.domain(), scenario.operation()),
             &mut failing_writer,
-            &localizer,
+            || &localizer,
         );
 
         match scenario {
@@ -274,4 +277,30 @@ mod tests {
             }
         }
     }
+
+    #[rstest]
+    #[case(None, None, true)]
+    #[case(Some("unknown-domain"), Some("status"), true)]
+    #[case(Some("observe"), None, true)]
+    #[case(Some("observe"), Some("get-definition"), false)]
+    fn preflight_builds_localizer_only_when_writing_guidance(
+        #[case] domain: Option<&str>,
+        #[case] operation: Option<&str>,
+        #[case] expected_built: bool,
+        preflight_context: PreflightContext,
+    ) {
+        let PreflightContext {
+            localizer,
+            mut stderr,
+        } = preflight_context;
+        let built = Cell::new(false);
+
+        let _result = handle_preflight(&cli(domain, operation), &mut stderr, || {
+            built.set(true);
+            localizer.as_ref()
+        });
+
+        assert_eq!(built.get(), expected_built);
+        assert_eq!(built.get(), !stderr.is_empty());
+    }
 }
@@ -140,10 +140,9 @@ pub(crate) fn build_request<R: Read>(
 }
 
 fn enforce_request_line_limit(request: &CommandRequest) -> Result<(), AppError> {
-    let json_len = serde_json::to_vec(request)
-        .map_err(AppError::SerialiseRequest)?
-        .len();
-    let request_line_len = json_len + 1;
+    let mut json_len = ByteCounter::default();
+    serde_json::to_writer(&mut json_len, request).map_err(AppError::SerialiseRequest)?;
+    let request_line_len = json_len.0 + 1;
     if request_line_len > JSONL_REQUEST_MAX_LINE_BYTES {
         return Err(AppError::RequestTooLarge {
             size: request_line_len,
@@ -153,6 +152,20 @@ fn enforce_request_line_limit(request: &CommandRequest) -> Result<(), AppError>
     Ok(())
 }
 
+/// Writer that only counts bytes, so a request can be measured against the
+/// line limit without materializing a throwaway JSON buffer.
+#[derive(Default)]
+struct ByteCounter(usize);
+
+impl Write for ByteCounter {
+    fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
+        self.0 = self.0.saturating_add(buf.len());
+        Ok(buf.len())
+    }
+
+    fn flush(&mut self) -> std::io::Result<()> { Ok(()) }
+}
+
 /// Writes `error` to `stderr` as a human-readable line and returns
 /// [`ExitCode::FAILURE`].
 ///
@@ -185,11 +185,17 @@ where
 }
 
 /// Writes lines to a stream, appending newlines and flushing.
+///
+/// The whole response is framed into one buffer first so the socket sees a
+/// single write rather than two per line.
 pub(in crate::tests) fn write_lines(stream: &mut impl Write, lines: &[String]) -> io::Result<()> {
+    let capacity = lines.iter().map(|line| line.len() + 1).sum();
+    let mut payload = Vec::with_capacity(capacity);
     for line in lines {
-        stream.write_all(line.as_bytes())?;
-        stream.write_all(b"\n")?;
+        payload.extend_from_slice(line.as_bytes());
+        payload.push(b'\n');
     }
+    stream.write_all(&payload)?;
     stream.flush()
 }
 
@@ -31,15 +31,18 @@ use weaver_test_macros::allow_fixture_expansion_lints;
 use crate::{AppError, ConfigLoader, IoStreams, lifecycle::LifecycleError, run_with_daemon_binary};
 
 /// A config loader that returns a fixed configuration for tests.
-pub(super) struct StaticConfigLoader {
-    config: Config,
+///
+/// The loader borrows the world's configuration so each step reuses it
+/// rather than cloning it into a fresh loader before every command.
+pub(super) struct StaticConfigLoader<'a> {
+    config: &'a Config,
 }
 
-impl StaticConfigLoader {
-    pub(super) fn new(config: Config) -> Self { Self { config } }
+impl<'a> StaticConfigLoader<'a> {
+    pub(super) const fn new(config: &'a Config) -> Self { Self { config } }
 }
 
-impl ConfigLoader for StaticConfigLoader {
+impl ConfigLoader for StaticConfigLoader<'_> {
     fn load(&self, _args: &[OsString]) -> Result<Config, AppError> { Ok(self.config.clone()) }
 }
 
@@ -157,9 +160,9 @@ impl TestWorld {
         self.stderr.clear();
         self.requests.clear();
         let args = Self::build_args(command);
-        let loader = StaticConfigLoader::new(self.config.clone());
+        let loader = StaticConfigLoader::new(&self.config);
         let daemon_binary = self.daemon_binary.as_deref();
-        let mut input = std::io::Cursor::new(self.stdin.clone());
+        let mut input = self.stdin.as_slice();
         let mut io = IoStreams::new(
             &mut input,
             &mut self.stdout,
@@ -326,12 +329,18 @@ pub(super) fn decode_utf8(buffer: Vec<u8>, label: &str) -> Result<String> {
     String::from_utf8(buffer).with_context(|| format!("{label} utf8"))
 }
 
+/// Canned daemon response shared by every default fake-daemon exchange.
+const DEFAULT_DAEMON_LINES: [&str; 3] = [
+    "{\"kind\":\"stream\",\"stream\":\"stdout\",\"data\":\"daemon says hello\"}",
+    "{\"kind\":\"stream\",\"stream\":\"stderr\",\"data\":\"daemon complains\"}",
+    "{\"kind\":\"exit\",\"status\":17}",
+];
+
+/// Exit record terminating successful stdout-only responses.
+const SUCCESS_EXIT_LINE: &str = "{\"kind\":\"exit\",\"status\":0}";
+
 pub(super) fn default_daemon_lines() -> Vec<String> {
-    vec![
-        "{\"kind\":\"stream\",\"stream\":\"stdout\",\"data\":\"daemon says hello\"}".to_string(),
-        "{\"kind\":\"stream\",\"stream\":\"stderr\",\"data\":\"daemon complains\"}".to_string(),
-        "{\"kind\":\"exit\",\"status\":17}".to_string(),
-    ]
+    DEFAULT_DAEMON_LINES.into_iter().map(String::from).collect()
 }
 
 /// Builds a stdout stream entry plus exit record for a custom payload.
@@ -346,7 +355,7 @@ pub(super) fn daemon_lines_for_stdout(payload: &str) -> Vec<String> {
     });
     vec![
         serde_json::to_string(&stream).expect("serialize stream"),
-        "{\"kind\":\"exit\",\"status\":0}".to_string(),
+        String::from(SUCCESS_EXIT_LINE),
     ]
 }
 
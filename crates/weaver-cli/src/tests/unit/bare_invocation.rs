@@ -231,7 +231,7 @@ fn bare_invocation_propagates_bare_help_write_failures() {
     };
     let mut stderr = FailingWriter;
 
-    let error = handle_preflight(&cli, &mut stderr, &NoOpLocalizer).expect_err("write failure");
+    let error = handle_preflight(&cli, &mut stderr, || &NoOpLocalizer).expect_err("write failure");
 
     assert!(matches!(error, AppError::EmitBareHelp(_)));
 }
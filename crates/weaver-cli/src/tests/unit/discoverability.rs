@@ -37,6 +37,19 @@ fn suggestion_for_unknown_domain_cases(#[case] input: &str, #[case] expected: Op
     assert_eq!(suggestion_for_unknown_domain(input), expected);
 }
 
+#[rstest]
+#[case("observe", Some(KnownDomain::Observe))]
+#[case("  ACT ", Some(KnownDomain::Act))]
+#[case("Verify", Some(KnownDomain::Verify))]
+#[case("obsrve", None)]
+#[case("", None)]
+fn try_parse_matches_domains_case_insensitively(
+    #[case] input: &str,
+    #[case] expected: Option<KnownDomain>,
+) {
+    assert_eq!(KnownDomain::try_parse(input), expected);
+}
+
 fn fluent_localizer() -> FluentLocalizer {
     FluentLocalizer::with_en_us_defaults([WEAVER_EN_US])
         .expect("embedded Fluent catalogue must parse")
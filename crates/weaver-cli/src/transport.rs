@@ -61,16 +61,17 @@ impl Write for Connection {
 pub(super) fn connect(endpoint: &SocketEndpoint) -> Result<Connection, AppError> {
     match endpoint {
         SocketEndpoint::Tcp { host, port } => {
-            let endpoint_display = endpoint.to_string();
+            // The endpoint is only rendered for error reports, so successful
+            // connections never format it.
             let address = resolve_tcp_address(host, *port).map_err(|error| AppError::Resolve {
-                endpoint: endpoint_display.clone(),
+                endpoint: endpoint.to_string(),
                 source: error,
             })?;
 
             TcpStream::connect_timeout(&address, CONNECTION_TIMEOUT)
                 .map(Connection::Tcp)
                 .map_err(|source| AppError::Connect {
-                    endpoint: endpoint_display,
+                    endpoint: endpoint.to_string(),
                     source,
                 })
         }
@@ -122,6 +123,11 @@ fn resolve_tcp_address(host: &str, port: u16) -> io::Result<SocketAddr> {
 
 #[cfg(unix)]
 fn connect_unix(path: &str) -> io::Result<Connection> {
+    // A missing socket file means the daemon is not running; report it with a
+    // single `stat` instead of creating and connecting a socket.
+    if !std::path::Path::new(path).try_exists()? {
+        return Err(io::ErrorKind::NotFound.into());
+    }
     let socket = Socket::new(Domain::UNIX, Type::STREAM, None)?;
     let address = SockAddr::unix(path)?;
     socket.connect_timeout(&address, CONNECTION_TIMEOUT)?;
@@ -1,6 +1,6 @@
 //! LSP-backed semantic lock adapter for apply-patch.
 
-use std::{collections::HashSet, path::Path, str::FromStr};
+use std::{borrow::Cow, collections::HashSet, path::Path, str::FromStr};
 
 use weaver_lsp_host::{Language, LspHost};
 
@@ -232,7 +232,7 @@ fn is_high_severity(severity: &Option<lsp_types::DiagnosticSeverity>) -> bool {
 
 fn diagnostics_signature_set(
     diagnostics: &[lsp_types::Diagnostic],
-) -> HashSet<DiagnosticSignature> {
+) -> HashSet<DiagnosticSignature<'_>> {
     diagnostics
         .iter()
         .filter(|diag| is_high_severity(&diag.severity))
@@ -240,26 +240,30 @@ fn diagnostics_signature_set(
         .collect()
 }
 
+/// Identity of a diagnostic for baseline comparison.
+///
+/// Signatures borrow from their diagnostic, so probing the baseline set for
+/// each updated diagnostic does not copy its message or code.
 #[derive(Debug, Hash, PartialEq, Eq)]
-struct DiagnosticSignature {
+struct DiagnosticSignature<'a> {
     line: u32,
     character: u32,
     severity: Option<u32>,
-    message: String,
-    code: Option<String>,
+    message: &'a str,
+    code: Option<Cow<'a, str>>,
 }
 
-impl From<&lsp_types::Diagnostic> for DiagnosticSignature {
-    fn from(diagnostic: &lsp_types::Diagnostic) -> Self {
+impl<'a> From<&'a lsp_types::Diagnostic> for DiagnosticSignature<'a> {
+    fn from(diagnostic: &'a lsp_types::Diagnostic) -> Self {
         let code = diagnostic.code.as_ref().map(|code| match code {
-            lsp_types::NumberOrString::Number(value) => value.to_string(),
-            lsp_types::NumberOrString::String(value) => value.clone(),
+            lsp_types::NumberOrString::Number(value) => Cow::Owned(value.to_string()),
+            lsp_types::NumberOrString::String(value) => Cow::Borrowed(value.as_str()),
         });
         Self {
             line: diagnostic.range.start.line,
             character: diagnostic.range.start.character,
             severity: diagnostic.severity.map(severity_code),
-            message: diagnostic.message.clone(),
+            message: diagnostic.message.as_str(),
             code,
         }
     }
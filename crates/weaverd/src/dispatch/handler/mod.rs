@@ -159,15 +159,24 @@ impl DispatchConnectionHandler {
     ) {
         let mut response = Vec::new();
         let route_result = self.backends.with_backends(|backends| {
-            let mut buffered_writer = ResponseWriter::new(&mut response);
+            let mut buffered_writer = ResponseWriter::buffered(&mut response);
             self.router.route(&request, &mut buffered_writer, backends)
         });
         let context = Self::request_context(&request, request_size);
 
         match route_result {
             Ok(Ok(result)) => {
-                if self.write_buffered_response(&context, writer, &response) {
-                    self.write_exit_status(&context, result.status, writer);
+                // Frame the exit status behind the routed output so the client
+                // receives the whole response in a single write. Framing into
+                // memory can only fail to serialize; transport failures are
+                // reported by `write_buffered_response`.
+                let mut buffered_writer = ResponseWriter::buffered(&mut response);
+                match buffered_writer.write_exit(result.status) {
+                    Ok(()) => self.write_buffered_response(&context, writer, &response),
+                    Err(error) => {
+                        tracing::warn!(target: DISPATCH_TARGET, %error, "failed to frame exit");
+                        self.write_error_response(&context, writer, &error);
+                    }
                 }
             }
             Ok(Err(error)) => {
@@ -196,7 +205,7 @@ impl DispatchConnectionHandler {
         context: &RouteContext<'_>,
         writer: &mut ResponseWriter<W>,
         response: &[u8],
-    ) -> bool {
+    ) {
         if let Err(transport_error) = writer.write_buffered(response) {
             tracing::warn!(
                 target: DISPATCH_TARGET,
@@ -207,9 +216,7 @@ impl DispatchConnectionHandler {
                 transport_error = %transport_error,
                 "failed to write routed response"
             );
-            return false;
         }
-        true
     }
 
     fn request_context(request: &CommandRequest, request_size: usize) -> RouteContext<'_> {
@@ -233,25 +240,6 @@ impl DispatchConnectionHandler {
         )
     }
 
-    fn write_exit_status<W: std::io::Write>(
-        &self,
-        context: &RouteContext<'_>,
-        status: i32,
-        writer: &mut ResponseWriter<W>,
-    ) {
-        if let Err(transport_error) = writer.write_exit(status) {
-            tracing::warn!(
-                target: DISPATCH_TARGET,
-                endpoint = %self.endpoint,
-                domain = context.request.domain(),
-                operation = context.request.operation(),
-                request_size = context.request_size,
-                transport_error = %transport_error,
-                "failed to write exit"
-            );
-        }
-    }
-
     fn write_error_response<W: std::io::Write>(
         &self,
         context: &RouteContext<'_>,
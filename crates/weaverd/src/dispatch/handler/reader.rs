@@ -11,6 +11,12 @@ use weaver_daemon_types::JSONL_REQUEST_MAX_LINE_BYTES;
 
 use crate::{dispatch::errors::DispatchError, transport::ConnectionStream};
 
+/// Size of each socket read while assembling a request line.
+///
+/// Requests may carry patches approaching `JSONL_REQUEST_MAX_LINE_BYTES`, so a
+/// larger chunk keeps the number of `read` calls per request small.
+const READ_CHUNK_BYTES: usize = 64 * 1024;
+
 /// Reads a bounded JSONL request line from the stream.
 ///
 /// Returns `Ok(None)` if the client disconnects without sending data.
@@ -22,7 +28,7 @@ pub(super) fn read_request_line(
     stream: &mut ConnectionStream,
 ) -> Result<Option<Vec<u8>>, DispatchError> {
     let mut buffer = Vec::new();
-    let mut chunk = [0_u8; 1024];
+    let mut chunk = [0_u8; READ_CHUNK_BYTES];
 
     loop {
         let bytes_read = read_with_retry(stream, &mut chunk)?;
@@ -4,10 +4,10 @@
 //! request failures and other notable states. Sensitive request data is
 //! redacted before serialization so the emitted logs remain safe to forward.
 
-use std::path::Path;
+use std::{borrow::Cow, path::Path};
 
-use serde_json::{Map, Value, json};
-use tracing::{error, info};
+use serde::Serialize;
+use tracing::{error, info, warn};
 
 use crate::dispatch::{errors::DispatchError, router::DISPATCH_TARGET};
 
@@ -51,21 +51,6 @@ impl StructuredEventMetadata {
         self.max_size = Some(max_size);
         self
     }
-
-    pub(super) fn extend_payload(&self, payload: &mut serde_json::Map<String, serde_json::Value>) {
-        if let Some(domain) = &self.domain {
-            payload.insert("domain".into(), json!(domain));
-        }
-        if let Some(operation) = &self.operation {
-            payload.insert("operation".into(), json!(operation));
-        }
-        if let Some(size) = self.size {
-            payload.insert("size".into(), json!(size));
-        }
-        if let Some(max_size) = self.max_size {
-            payload.insert("max_size".into(), json!(max_size));
-        }
-    }
 }
 
 /// Structured event payload assembled by the dispatch handler.
@@ -127,67 +112,116 @@ pub(super) fn read_error_event(
     }
 }
 
-fn redacted(value: &Option<String>) -> Option<Value> {
-    value
-        .as_ref()
-        .map(|_| Value::String(REDACTION_MARKER.to_owned()))
+/// Borrowed JSON view of a structured event, serialized without an
+/// intermediate `serde_json::Map`.
+///
+/// Fields are declared in the byte order of their emitted keys so the JSON
+/// object keeps the sorted key order the `Map`-based payload produced.
+#[derive(Serialize)]
+struct StructuredEventPayload<'a> {
+    #[serde(skip_serializing_if = "Option::is_none")]
+    body: Option<&'static str>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    domain: Option<&'a str>,
+    endpoint: &'a str,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    env: Option<&'static str>,
+    event: &'static str,
+    #[serde(rename = "fullPayload", skip_serializing_if = "Option::is_none")]
+    full_payload: Option<&'static str>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    max_size: Option<usize>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    operation: Option<&'a str>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    patch: Option<&'static str>,
+    runtime_dir: Cow<'a, str>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    size: Option<usize>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    source: Option<&'static str>,
+    #[serde(rename = "weaverd.health")]
+    health_path: String,
 }
 
-/// Serializes a structured event into JSON with sensitive fields redacted.
-///
-/// The handler stores request bodies, patches, source text, environment
-/// snapshots, and full payloads behind a stable redaction marker instead of
-/// logging the raw values.
-pub(super) fn serialize_structured_event(event: &StructuredDispatchEvent) -> Value {
-    let mut payload = Map::<String, Value>::new();
-    payload.insert("event".into(), json!(event.event));
-    payload.insert("endpoint".into(), json!(event.endpoint));
-    payload.insert(
-        "runtime_dir".into(),
-        json!(event.runtime_dir.to_string_lossy().to_string()),
-    );
-    payload.insert(
-        "weaverd.health".into(),
-        json!(
-            event
+impl<'a> StructuredEventPayload<'a> {
+    fn new(event: &'a StructuredDispatchEvent) -> Self {
+        let metadata = &event.metadata;
+        Self {
+            body: redacted(&event.body),
+            domain: metadata.domain.as_deref(),
+            endpoint: &event.endpoint,
+            env: redacted(&event.env),
+            event: event.event,
+            full_payload: redacted(&event.full_payload),
+            max_size: metadata.max_size,
+            operation: metadata.operation.as_deref(),
+            patch: redacted(&event.patch),
+            runtime_dir: event.runtime_dir.to_string_lossy(),
+            size: metadata.size,
+            source: redacted(&event.source),
+            health_path: event
                 .runtime_dir
                 .join(HEALTH_SNAPSHOT_NAME)
                 .to_string_lossy()
-                .to_string()
-        ),
-    );
-
-    event.metadata.extend_payload(&mut payload);
-    let redacted_fields: &[(&str, &Option<String>)] = &[
-        ("patch", &event.patch),
-        ("body", &event.body),
-        ("source", &event.source),
-        ("env", &event.env),
-        ("fullPayload", &event.full_payload),
-    ];
-    for (key, value) in redacted_fields {
-        if let Some(redacted) = redacted(value) {
-            payload.insert((*key).into(), redacted);
+                .into_owned(),
         }
     }
+}
 
-    Value::Object(payload)
+fn redacted(value: &Option<String>) -> Option<&'static str> {
+    value.as_ref().map(|_| REDACTION_MARKER)
 }
 
-pub(super) fn format_structured_event(event: &StructuredDispatchEvent) -> String {
-    serialize_structured_event(event).to_string()
+/// Serializes a structured event into JSON with sensitive fields redacted.
+///
+/// The handler stores request bodies, patches, source text, environment
+/// snapshots, and full payloads behind a stable redaction marker instead of
+/// logging the raw values.
+#[cfg(test)]
+pub(super) fn serialize_structured_event(event: &StructuredDispatchEvent) -> serde_json::Value {
+    serde_json::json!(StructuredEventPayload::new(event))
+}
+
+/// Formats a structured event as a single JSON line for tracing.
+///
+/// The payload is written straight to a string, avoiding a throwaway
+/// `serde_json::Value` tree on every logged event.
+///
+/// # Errors
+///
+/// Returns the `serde_json::Error` raised if the payload cannot be
+/// serialized.
+pub(super) fn format_structured_event(
+    event: &StructuredDispatchEvent,
+) -> Result<String, serde_json::Error> {
+    serde_json::to_string(&StructuredEventPayload::new(event))
 }
 
 /// Emits the structured dispatch event through tracing on the dispatch target.
 ///
 /// The handler uses `info!` for normal structured events and `error!` for
-/// failure paths so downstream consumers can distinguish severity.
+/// failure paths so downstream consumers can distinguish severity. If the
+/// payload cannot be serialized, a warning naming the event and the error is
+/// logged instead.
 pub(super) fn emit_structured_event(
     event: &StructuredDispatchEvent,
     message: &str,
     is_error: bool,
 ) {
-    let payload = format_structured_event(event);
+    let payload = match format_structured_event(event) {
+        Ok(payload) => payload,
+        Err(error) => {
+            warn!(
+                target: DISPATCH_TARGET,
+                event = %event.event,
+                message = %message,
+                %error,
+                "failed to serialize structured dispatch event"
+            );
+            return;
+        }
+    };
     if is_error {
         error!(
             target: DISPATCH_TARGET,
@@ -184,6 +184,7 @@ fn serialize_dispatching_request_event_snapshot() {
         insta::assert_json_snapshot!(
             serde_json::from_str::<serde_json::Value>(
                 &format_structured_event(&event)
+                    .expect("structured event should format")
             ).expect("structured event should serialize as JSON")
         );
     });
@@ -214,6 +215,7 @@ fn serialize_request_too_large_event_snapshot() {
         insta::assert_json_snapshot!(
             serde_json::from_str::<serde_json::Value>(
                 &format_structured_event(&event)
+                    .expect("structured event should format")
             ).expect("structured event should serialize as JSON")
         );
     });
@@ -236,7 +238,7 @@ fn emit_structured_event_returns_payload_without_sensitive_request_data() {
     event.source = Some("sensitive source".to_string());
     event.env = Some("PATH=secret".to_string());
     event.full_payload = Some("full json payload".to_string());
-    let payload = format_structured_event(&event);
+    let payload = format_structured_event(&event).expect("format structured event");
     let value = serde_json::from_str::<serde_json::Value>(&payload)
         .expect("valid structured event payload");
 
@@ -248,6 +250,32 @@ fn emit_structured_event_returns_payload_without_sensitive_request_data() {
     assert_eq!(value["env"], serde_json::json!("<redacted>"));
     assert_eq!(value["fullPayload"], serde_json::json!("<redacted>"));
     assert_eq!(value["domain"], serde_json::json!("observe"));
+    let key_positions: Vec<usize> = [
+        "body",
+        "domain",
+        "endpoint",
+        "env",
+        "event",
+        "fullPayload",
+        "max_size",
+        "operation",
+        "patch",
+        "runtime_dir",
+        "size",
+        "source",
+        "weaverd.health",
+    ]
+    .iter()
+    .map(|key| {
+        payload
+            .find(&format!("\"{key}\":"))
+            .expect("key present in payload")
+    })
+    .collect();
+    assert!(
+        key_positions.is_sorted(),
+        "payload keys should be sorted: {payload}"
+    );
     let events = capture_events(|| {
         emit_structured_event(&event, "request_too_large rejection", true);
     });
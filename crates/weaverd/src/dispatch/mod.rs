@@ -39,6 +39,8 @@ mod router;
 
 #[doc(hidden)]
 pub use self::backend_manager::BackendManager;
+#[cfg(test)]
+pub(crate) use self::errors::DispatchError;
 #[doc(hidden)]
 pub use self::handler::DispatchConnectionHandler;
 #[cfg(test)]
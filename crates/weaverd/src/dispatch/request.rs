@@ -38,15 +38,15 @@ impl CommandRequest {
     /// Parses a JSONL line into a command request.
     ///
     /// Validates that the line is valid JSON and matches the expected schema.
-    /// Trailing whitespace (including the newline delimiter) is trimmed before
-    /// parsing.
+    /// Trailing whitespace (including the newline delimiter) is excluded by
+    /// borrowing a shorter view of `line`, so no copy is made before parsing.
     ///
     /// # Errors
     ///
     /// Returns `DispatchError::MalformedJsonl` if the line is empty or cannot
     /// be parsed as valid JSON matching the `CommandRequest` schema.
     pub fn parse(line: &[u8]) -> Result<Self, DispatchError> {
-        let trimmed = trim_trailing_whitespace(line);
+        let trimmed = line.trim_ascii_end();
         if trimmed.is_empty() {
             return Err(DispatchError::malformed("empty request line"));
         }
@@ -80,16 +80,6 @@ impl CommandRequest {
     pub fn patch(&self) -> Option<&str> { self.patch.as_deref() }
 }
 
-/// Trims trailing ASCII whitespace from a byte slice.
-fn trim_trailing_whitespace(bytes: &[u8]) -> &[u8] {
-    let end = bytes
-        .iter()
-        .rposition(|b| !b.is_ascii_whitespace())
-        .map(|pos| pos + 1)
-        .unwrap_or(0);
-    &bytes[..end]
-}
-
 #[cfg(test)]
 mod tests {
     //! Unit tests for command request parsing and validation.
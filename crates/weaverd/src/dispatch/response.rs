@@ -73,6 +73,10 @@ impl DaemonMessage {
 /// convenience methods for common message patterns.
 pub struct ResponseWriter<W> {
     writer: W,
+    /// Serialization buffer reused for every message written by this writer,
+    /// or `None` when `writer` already buffers in memory and frames are
+    /// serialized straight into it.
+    line: Option<Vec<u8>>,
 }
 
 #[derive(Debug, Serialize)]
@@ -92,16 +96,47 @@ struct UnknownOperationDetails<'a> {
 
 impl<W: Write> ResponseWriter<W> {
     /// Creates a new response writer wrapping the given output stream.
-    pub fn new(writer: W) -> Self { Self { writer } }
+    pub fn new(writer: W) -> Self {
+        Self {
+            writer,
+            line: Some(Vec::new()),
+        }
+    }
+
+    /// Creates a response writer over an in-memory buffer.
+    ///
+    /// Frames are serialized directly into `writer` rather than staged in a
+    /// scratch line first, which would only copy each frame a second time.
+    pub(crate) fn buffered(writer: W) -> Self { Self { writer, line: None } }
 
     /// Writes a daemon message as a JSONL line.
     ///
+    /// On a writer made by [`ResponseWriter::new`] the line is serialized into
+    /// a buffer reused across messages and handed over in a single
+    /// `write_all`, so an unbuffered socket sees one write per message instead
+    /// of one per JSON token.
+    ///
     /// # Errors
     ///
     /// Returns an error if serialization or writing fails.
     pub fn write_message(&mut self, message: &DaemonMessage) -> Result<(), DispatchError> {
-        serde_json::to_writer(&mut self.writer, message)?;
-        self.writer.write_all(b"\n")?;
+        self.write_frames(std::slice::from_ref(message))
+    }
+
+    /// Writes `messages` as consecutive JSONL frames in one `write_all`, or
+    /// straight into the writer when it buffers in memory.
+    fn write_frames(&mut self, messages: &[DaemonMessage]) -> Result<(), DispatchError> {
+        let Some(line) = self.line.as_mut() else {
+            for message in messages {
+                push_frame(&mut self.writer, message)?;
+            }
+            return Ok(());
+        };
+        line.clear();
+        for message in messages {
+            push_frame(line, message)?;
+        }
+        self.writer.write_all(line)?;
         Ok(())
     }
 
@@ -147,34 +182,38 @@ impl<W: Write> ResponseWriter<W> {
 
     /// Writes an error message to stderr followed by an exit message.
     ///
-    /// For `DispatchError::UnknownOperation`, this emits a structured JSON
-    /// payload via `write_unknown_operation_error(...)` and `write_stderr(...)`
-    /// so clients can render the canonical `known_operations` list. All other
+    /// For `DispatchError::UnknownOperation`, the stderr frame carries a
+    /// structured JSON payload built by `unknown_operation_payload(...)` so
+    /// clients can render the canonical `known_operations` list. All other
     /// errors write the error's display representation to stderr. In every
-    /// case, the method then sends an exit message using `error.exit_status()`
-    /// via `write_exit(...)`.
+    /// case, an exit message using `error.exit_status()` follows, and both
+    /// frames are sent to the client in a single write before flushing.
     ///
     /// # Errors
     ///
     /// Returns an error if writing fails.
     pub fn write_error(&mut self, error: &DispatchError) -> Result<(), DispatchError> {
-        match error {
+        let data = match error {
             DispatchError::UnknownOperation {
                 domain,
                 operation,
                 known_operations,
-            } => self.write_unknown_operation_error(domain, operation, known_operations)?,
-            _ => self.write_stderr(format!("error: {error}\n"))?,
-        }
-        self.write_exit(error.exit_status())
+            } => Self::unknown_operation_payload(domain, operation, known_operations)?,
+            _ => format!("error: {error}\n"),
+        };
+        self.write_frames(&[
+            DaemonMessage::stderr(data),
+            DaemonMessage::exit(error.exit_status()),
+        ])?;
+        self.writer.flush()?;
+        Ok(())
     }
 
-    fn write_unknown_operation_error(
-        &mut self,
+    fn unknown_operation_payload(
         domain: &str,
         operation: &str,
         known_operations: &'static [&'static str],
-    ) -> Result<(), DispatchError> {
+    ) -> Result<String, DispatchError> {
         let payload = UnknownOperationPayload {
             status: "error",
             kind: UNKNOWN_OPERATION_TYPE,
@@ -184,11 +223,17 @@ impl<W: Write> ResponseWriter<W> {
                 known_operations,
             },
         };
-        let data = serde_json::to_string(&payload)?;
-        self.write_stderr(data)
+        Ok(serde_json::to_string(&payload)?)
     }
 }
 
+/// Appends one JSONL frame for `message` to `out`.
+fn push_frame<O: Write>(out: &mut O, message: &DaemonMessage) -> Result<(), DispatchError> {
+    serde_json::to_writer(&mut *out, message)?;
+    out.write_all(b"\n")?;
+    Ok(())
+}
+
 #[cfg(test)]
 pub(crate) fn parse_stderr_json_payload<T>(line: &str) -> Option<T>
 where
@@ -221,6 +266,25 @@ mod tests {
         assert!(response.ends_with('\n'));
     }
 
+    #[test]
+    fn buffered_writer_emits_the_same_frames() {
+        let mut staged = Vec::new();
+        let mut direct = Vec::new();
+        let error = DispatchError::unknown_domain("bogus");
+        let mut staged_writer = ResponseWriter::new(&mut staged);
+        staged_writer
+            .write_stdout("result data")
+            .expect("write stdout");
+        staged_writer.write_error(&error).expect("write error");
+        let mut direct_writer = ResponseWriter::buffered(&mut direct);
+        direct_writer
+            .write_stdout("result data")
+            .expect("write stdout");
+        direct_writer.write_error(&error).expect("write error");
+
+        assert_eq!(staged, direct);
+    }
+
     #[test]
     fn writes_stdout_stream() {
         let mut output = Vec::new();
@@ -44,12 +44,10 @@ impl Domain {
     /// Returns `DispatchError::UnknownDomain` if the value does not match any
     /// known domain.
     pub fn parse(value: &str) -> Result<Self, DispatchError> {
-        match value.to_ascii_lowercase().as_str() {
-            "observe" => Ok(Self::Observe),
-            "act" => Ok(Self::Act),
-            "verify" => Ok(Self::Verify),
-            _ => Err(DispatchError::unknown_domain(value)),
-        }
+        [Self::Observe, Self::Act, Self::Verify]
+            .into_iter()
+            .find(|domain| value.eq_ignore_ascii_case(domain.as_str()))
+            .ok_or_else(|| DispatchError::unknown_domain(value))
     }
 
     /// Returns the canonical string representation.
@@ -114,6 +112,15 @@ impl DomainRoutingContext {
         domain: "verify",
         known_operations: &["diagnostics", "syntax"],
     };
+
+    /// Returns the canonical spelling of `operation`, ignoring ASCII case, or
+    /// `None` when the domain does not know it.
+    fn canonical_operation(&self, operation: &str) -> Option<&'static str> {
+        self.known_operations
+            .iter()
+            .copied()
+            .find(|known| known.eq_ignore_ascii_case(operation))
+    }
 }
 
 /// Routes commands to domain handlers.
@@ -206,12 +213,12 @@ impl DomainRouter {
         writer: &mut ResponseWriter<W>,
         backends: &mut FusionBackends<SemanticBackendProvider>,
     ) -> Result<DispatchResult, DispatchError> {
-        let operation = request.operation().to_ascii_lowercase();
-        match operation.as_str() {
-            "get-definition" => observe::get_definition::handle(request, writer, backends),
-            "get-card" => observe::get_card::handle(request, writer, backends),
-            "graph-slice" => observe::graph_slice::handle(request, writer, backends),
-            _ => Self::route_fallback(&DomainRoutingContext::OBSERVE, operation.as_str(), writer),
+        let routing = &DomainRoutingContext::OBSERVE;
+        match routing.canonical_operation(request.operation()) {
+            Some("get-definition") => observe::get_definition::handle(request, writer, backends),
+            Some("get-card") => observe::get_card::handle(request, writer, backends),
+            Some("graph-slice") => observe::graph_slice::handle(request, writer, backends),
+            known => Self::route_fallback(routing, known, request.operation(), writer),
         }
     }
 
@@ -221,12 +228,12 @@ impl DomainRouter {
         writer: &mut ResponseWriter<W>,
         backends: &mut FusionBackends<SemanticBackendProvider>,
     ) -> Result<DispatchResult, DispatchError> {
-        let operation = request.operation().to_ascii_lowercase();
-        match operation.as_str() {
-            "apply-patch" => {
+        let routing = &DomainRoutingContext::ACT;
+        match routing.canonical_operation(request.operation()) {
+            Some("apply-patch") => {
                 act::apply_patch::handle(request, writer, backends, &self.workspace_root)
             }
-            "refactor" => act::refactor::handle(
+            Some("refactor") => act::refactor::handle(
                 request,
                 writer,
                 act::refactor::RefactorContext {
@@ -235,7 +242,7 @@ impl DomainRouter {
                     runtime: self.refactor_runtime.as_ref(),
                 },
             ),
-            _ => Self::route_fallback(&DomainRoutingContext::ACT, operation.as_str(), writer),
+            known => Self::route_fallback(routing, known, request.operation(), writer),
         }
     }
 
@@ -244,24 +251,28 @@ impl DomainRouter {
         request: &CommandRequest,
         writer: &mut ResponseWriter<W>,
     ) -> Result<DispatchResult, DispatchError> {
-        let operation = request.operation().to_ascii_lowercase();
-        Self::route_fallback(&DomainRoutingContext::VERIFY, operation.as_str(), writer)
+        let routing = &DomainRoutingContext::VERIFY;
+        let known = routing.canonical_operation(request.operation());
+        Self::route_fallback(routing, known, request.operation(), writer)
     }
 
     /// Handles routing fallbacks for known-but-unimplemented and unknown operations.
+    ///
+    /// `known` is the canonical spelling of `operation` when the domain lists
+    /// it; unknown operations are reported in lowercase.
     fn route_fallback<W: Write>(
         routing: &DomainRoutingContext,
+        known: Option<&'static str>,
         operation: &str,
         writer: &mut ResponseWriter<W>,
     ) -> Result<DispatchResult, DispatchError> {
-        if routing.known_operations.contains(&operation) {
-            Self::write_not_implemented(writer, routing.domain, operation)
-        } else {
-            Err(DispatchError::unknown_operation(
+        match known {
+            Some(known) => Self::write_not_implemented(writer, routing.domain, known),
+            None => Err(DispatchError::unknown_operation(
                 routing.domain,
-                operation.to_string(),
+                operation.to_ascii_lowercase(),
                 routing.known_operations,
-            ))
+            )),
         }
     }
 
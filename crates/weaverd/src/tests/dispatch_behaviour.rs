@@ -4,78 +4,44 @@ use std::{
     cell::RefCell,
     io::{BufRead, BufReader, Write},
     net::{SocketAddr, TcpStream},
-    sync::{Arc, Mutex},
     time::Duration,
 };
 
 use rstest::fixture;
 use rstest_bdd_macros::{given, scenario, then, when};
 use serde_json::Value;
-use weaver_cards::DEFAULT_CACHE_CAPACITY;
-use weaver_config::{CapabilityMatrix, Config, SocketEndpoint};
+use weaver_config::SocketEndpoint;
 
 use crate::{
-    backends::FusionBackends,
-    dispatch::{
-        BackendManager,
-        DispatchConnectionHandler,
-        UNKNOWN_OPERATION_TYPE,
-        parse_stderr_json_payload,
-    },
-    semantic_provider::SemanticBackendProvider,
+    dispatch::{UNKNOWN_OPERATION_TYPE, parse_stderr_json_payload},
+    tests::support::dispatch_handler,
     transport::{ListenerHandle, SocketListener},
 };
 
-/// Test fixture providing a configured `DispatchConnectionHandler` with test backends.
-#[fixture]
-fn test_handler() -> Arc<DispatchConnectionHandler> {
-    let config = Config {
-        daemon_socket: SocketEndpoint::unix("/tmp/weaver-bdd-test/socket.sock"),
-        ..Config::default()
-    };
-    let provider =
-        SemanticBackendProvider::new(CapabilityMatrix::default(), DEFAULT_CACHE_CAPACITY);
-    let backends = Arc::new(Mutex::new(FusionBackends::new(config, provider)));
-    let backend_manager = BackendManager::new(backends);
-    let workspace_root = std::env::current_dir().expect("workspace root");
-    Arc::new(
-        DispatchConnectionHandler::new(
-            backend_manager,
-            workspace_root,
-            "/tmp/weaver-bdd-test/socket.sock",
-            std::env::temp_dir(),
-        )
-        .expect("absolute workspace root"),
-    )
-}
-
 struct DispatchWorld {
     endpoint: SocketEndpoint,
-    handler: Arc<DispatchConnectionHandler>,
     listener: Option<ListenerHandle>,
     address: Option<SocketAddr>,
     response_lines: Vec<String>,
 }
 
 impl DispatchWorld {
-    fn with_handler(handler: Arc<DispatchConnectionHandler>) -> Self {
+    fn new() -> Self {
         Self {
             endpoint: SocketEndpoint::tcp("127.0.0.1", 0),
-            handler,
             listener: None,
             address: None,
             response_lines: Vec::new(),
         }
     }
 
-    fn start_listener(&mut self) {
-        let listener = SocketListener::bind(&self.endpoint).expect("bind listener");
+    fn start_listener(&mut self) -> Result<(), String> {
+        let handler = dispatch_handler("/tmp/weaver-bdd-test/socket.sock")
+            .map_err(|error| error.to_string())?;
+        let listener = SocketListener::bind(&self.endpoint).map_err(|error| error.to_string())?;
         self.address = listener.local_addr();
-        self.listener = Some(
-            listener
-                .start(self.handler.clone())
-                .expect("start listener"),
-        );
+        self.listener = Some(listener.start(handler).map_err(|error| error.to_string())?);
+        Ok(())
     }
 
     fn send_request(&mut self, request: &str) {
@@ -89,12 +55,11 @@ impl DispatchWorld {
         stream.write_all(b"\n").expect("write newline");
         stream.flush().expect("flush");
 
-        let mut reader = BufReader::new(stream);
-        let mut line = String::new();
-        while reader.read_line(&mut line).expect("read") > 0 {
-            self.response_lines.push(line.trim().to_string());
-            line.clear();
-        }
+        // `lines` strips each newline in place, so frames are stored without
+        // a trimmed copy.
+        let reader = BufReader::new(stream);
+        self.response_lines
+            .extend(reader.lines().map(|line| line.expect("read")));
     }
 
     fn has_exit_message(&self, status: i32) -> bool {
@@ -147,12 +112,12 @@ impl Drop for DispatchWorld {
 }
 
 #[fixture]
-fn world(test_handler: Arc<DispatchConnectionHandler>) -> RefCell<DispatchWorld> {
-    RefCell::new(DispatchWorld::with_handler(test_handler))
-}
+fn world() -> RefCell<DispatchWorld> { RefCell::new(DispatchWorld::new()) }
 
 #[given("a daemon connection is established")]
-fn given_daemon_connection(world: &RefCell<DispatchWorld>) { world.borrow_mut().start_listener(); }
+fn given_daemon_connection(world: &RefCell<DispatchWorld>) -> Result<(), String> {
+    world.borrow_mut().start_listener()
+}
 
 #[when("an observe get-definition request is sent without arguments")]
 fn when_observe_request_without_args(world: &RefCell<DispatchWorld>) {
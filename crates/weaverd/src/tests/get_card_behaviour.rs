@@ -4,9 +4,9 @@ use std::{
     cell::RefCell,
     collections::HashMap,
     io::{BufRead, BufReader, Write},
+    mem,
     net::{SocketAddr, TcpStream},
     path::PathBuf,
-    sync::{Arc, Mutex},
     time::Duration,
 };
 
@@ -14,43 +14,15 @@ use rstest::fixture;
 use rstest_bdd_macros::{given, scenario, then, when};
 use tempfile::TempDir;
 use url::Url;
-use weaver_cards::DEFAULT_CACHE_CAPACITY;
-use weaver_config::{CapabilityMatrix, Config, SocketEndpoint};
+use weaver_config::SocketEndpoint;
 
 use crate::{
-    backends::FusionBackends,
-    dispatch::{BackendManager, DispatchConnectionHandler},
-    semantic_provider::SemanticBackendProvider,
-    tests::support::fs as test_fs,
+    tests::support::{dispatch_handler, fs as test_fs},
     transport::{ListenerHandle, SocketListener},
 };
 
-#[fixture]
-fn test_handler() -> Arc<DispatchConnectionHandler> {
-    let config = Config {
-        daemon_socket: SocketEndpoint::unix("/tmp/weaver-bdd-get-card/socket.sock"),
-        ..Config::default()
-    };
-    let provider =
-        SemanticBackendProvider::new(CapabilityMatrix::default(), DEFAULT_CACHE_CAPACITY);
-    let backends = Arc::new(Mutex::new(FusionBackends::new(config, provider)));
-    let backend_manager = BackendManager::new(backends);
-    let workspace_root = std::env::current_dir().expect("workspace root");
-    let runtime_dir = std::env::temp_dir();
-    Arc::new(
-        DispatchConnectionHandler::new(
-            backend_manager,
-            workspace_root,
-            "/tmp/weaver-bdd-get-card/socket.sock",
-            runtime_dir,
-        )
-        .expect("absolute workspace root"),
-    )
-}
-
 struct GetCardWorld {
     endpoint: SocketEndpoint,
-    handler: Arc<DispatchConnectionHandler>,
     listener: Option<ListenerHandle>,
     address: Option<SocketAddr>,
     temp_dir: TempDir,
@@ -68,10 +40,9 @@ struct GetCardRequest<'a> {
 }
 
 impl GetCardWorld {
-    fn with_handler(handler: Arc<DispatchConnectionHandler>) -> Self {
+    fn new() -> Self {
         Self {
             endpoint: SocketEndpoint::tcp("127.0.0.1", 0),
-            handler,
             listener: None,
             address: None,
             temp_dir: TempDir::new().expect("temp dir"),
@@ -82,14 +53,13 @@ impl GetCardWorld {
         }
     }
 
-    fn start_listener(&mut self) {
-        let listener = SocketListener::bind(&self.endpoint).expect("bind listener");
+    fn start_listener(&mut self) -> Result<(), String> {
+        let handler = dispatch_handler("/tmp/weaver-bdd-get-card/socket.sock")
+            .map_err(|error| error.to_string())?;
+        let listener = SocketListener::bind(&self.endpoint).map_err(|error| error.to_string())?;
         self.address = listener.local_addr();
-        self.listener = Some(
-            listener
-                .start(self.handler.clone())
-                .expect("start listener"),
-        );
+        self.listener = Some(listener.start(handler).map_err(|error| error.to_string())?);
+        Ok(())
     }
 
     fn write_fixture(&mut self, key: &str, name: &str, source: &str) {
@@ -126,14 +96,12 @@ impl GetCardWorld {
         stream.write_all(b"\n").expect("write newline");
         stream.flush().expect("flush");
 
-        self.previous_response_lines = Some(self.response_lines.clone());
-        self.response_lines.clear();
-        let mut reader = BufReader::new(stream);
-        let mut line_buffer = String::new();
-        while reader.read_line(&mut line_buffer).expect("read") > 0 {
-            self.response_lines.push(line_buffer.trim().to_string());
-            line_buffer.clear();
-        }
+        self.previous_response_lines = Some(mem::take(&mut self.response_lines));
+        // `lines` strips each newline in place, so frames are stored without
+        // a trimmed copy.
+        let reader = BufReader::new(stream);
+        self.response_lines
+            .extend(reader.lines().map(|line| line.expect("read")));
     }
 
     fn stdout_contains(&self, needle: &str) -> bool {
@@ -193,12 +161,12 @@ impl Drop for GetCardWorld {
 }
 
 #[fixture]
-fn world(test_handler: Arc<DispatchConnectionHandler>) -> RefCell<GetCardWorld> {
-    RefCell::new(GetCardWorld::with_handler(test_handler))
-}
+fn world() -> RefCell<GetCardWorld> { RefCell::new(GetCardWorld::new()) }
 
 #[given("a daemon connection is established for get-card")]
-fn given_daemon_connection(world: &RefCell<GetCardWorld>) { world.borrow_mut().start_listener(); }
+fn given_daemon_connection(world: &RefCell<GetCardWorld>) -> Result<(), String> {
+    world.borrow_mut().start_listener()
+}
 
 #[given("a supported Rust source fixture")]
 fn given_supported_rust_fixture(world: &RefCell<GetCardWorld>) {
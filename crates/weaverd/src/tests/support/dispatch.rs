@@ -0,0 +1,67 @@
+//! Dispatch handler construction shared by the socket-level behaviour suites.
+
+use std::{
+    io,
+    sync::{Arc, Mutex},
+};
+
+use thiserror::Error;
+use weaver_cards::DEFAULT_CACHE_CAPACITY;
+use weaver_config::{CapabilityMatrix, Config, SocketEndpoint};
+
+use crate::{
+    backends::FusionBackends,
+    dispatch::{BackendManager, DispatchConnectionHandler, DispatchError},
+    semantic_provider::SemanticBackendProvider,
+};
+
+/// Errors raised while building a test dispatch handler.
+#[derive(Debug, Error)]
+pub enum DispatchHandlerError {
+    /// The current directory could not be read to serve as workspace root.
+    #[error("failed to resolve workspace root: {source}")]
+    WorkspaceRoot {
+        #[source]
+        source: io::Error,
+    },
+    /// The dispatch handler rejected the workspace root.
+    #[error("failed to construct dispatch handler: {source}")]
+    Handler {
+        #[source]
+        source: DispatchError,
+    },
+}
+
+/// Builds a `DispatchConnectionHandler` over default semantic backends.
+///
+/// `socket_path` names the daemon socket recorded in the handler's
+/// configuration; it is never bound. The current directory serves as the
+/// workspace root and the system temporary directory as the runtime
+/// directory.
+///
+/// # Errors
+///
+/// Returns [`DispatchHandlerError`] when the current directory cannot be
+/// resolved or the handler rejects it as a workspace root.
+pub fn dispatch_handler(
+    socket_path: &str,
+) -> Result<Arc<DispatchConnectionHandler>, DispatchHandlerError> {
+    let config = Config {
+        daemon_socket: SocketEndpoint::unix(socket_path),
+        ..Config::default()
+    };
+    let provider =
+        SemanticBackendProvider::new(CapabilityMatrix::default(), DEFAULT_CACHE_CAPACITY);
+    let backends = Arc::new(Mutex::new(FusionBackends::new(config, provider)));
+    let backend_manager = BackendManager::new(backends);
+    let workspace_root =
+        std::env::current_dir().map_err(|source| DispatchHandlerError::WorkspaceRoot { source })?;
+    let handler = DispatchConnectionHandler::new(
+        backend_manager,
+        workspace_root,
+        socket_path,
+        std::env::temp_dir(),
+    )
+    .map_err(|source| DispatchHandlerError::Handler { source })?;
+    Ok(Arc::new(handler))
+}
@@ -2,6 +2,7 @@
 
 mod backend_provider;
 mod config_loader;
+mod dispatch;
 pub mod fs;
 mod process_world;
 mod reporter;
@@ -9,6 +10,7 @@ mod world;
 
 pub use backend_provider::RecordingBackendProvider;
 pub use config_loader::{FailingConfigLoader, TestConfigLoader};
+pub use dispatch::{DispatchHandlerError, dispatch_handler};
 pub use process_world::{ProcessTestWorld, snapshot_status};
 pub use reporter::{HealthEvent, RecordingHealthReporter};
 pub use world::{TestWorld, world};
@@ -143,7 +143,15 @@ pub(crate) struct ListenerHandle {
 
 impl ListenerHandle {
     /// Signals the accept loop to shut down.
-    pub(crate) fn shutdown(&self) { self.shutdown.store(true, Ordering::SeqCst); }
+    ///
+    /// The accept loop backs off by parking its thread, so unparking it here
+    /// lets shutdown proceed immediately instead of waiting out the backoff.
+    pub(crate) fn shutdown(&self) {
+        self.shutdown.store(true, Ordering::SeqCst);
+        if let Some(handle) = &self.handle {
+            handle.thread().unpark();
+        }
+    }
 
     /// Waits for the accept loop to complete.
     ///
@@ -162,7 +170,7 @@ impl ListenerHandle {
 
 impl Drop for ListenerHandle {
     fn drop(&mut self) {
-        self.shutdown.store(true, Ordering::SeqCst);
+        self.shutdown();
         if let Some(handle) = self.handle.take()
             && handle.join().is_err()
         {
@@ -232,7 +240,9 @@ fn run_accept_loop(
     let limiter = HandlerLimiter::new(MAX_HANDLER_THREADS);
     while !shutdown.load(Ordering::SeqCst) {
         if let Some(delay) = handle_accept_cycle(listener, &handler, &limiter, &mut last_error) {
-            thread::sleep(delay);
+            // Parking rather than sleeping lets `ListenerHandle::shutdown` cut
+            // the backoff short; spurious wakeups simply re-poll the listener.
+            thread::park_timeout(delay);
         }
     }
 
@@ -66,6 +66,56 @@ def test_checker_boundaries_ignores_exclusions(
     assert actual == expected, "phrase boundaries or policy exclusions changed"
 
 
+def test_checker_masks_multiline_spans_without_moving_lines(
+    modules: tuple[types.ModuleType, types.ModuleType],
+    tmp_path: Path,
+) -> None:
+    """Ignored spans crossing newlines keep later findings on their lines."""
+    rollout, check = modules
+    initialize(
+        tmp_path,
+        {"README.md": f"```\n{PROHIBITED}\n```\nsee {PROHIBITED}\n"},
+    )
+    policy = rollout.Dictionary(
+        phrase_corrections=((PROHIBITED, "handwritten"),),
+        ignore_patterns=(r"(?s)```.*?```",),
+    )
+
+    actual = [
+        (finding.line, finding.column)
+        for finding in check.check_phrase_corrections(tmp_path, policy)
+    ]
+
+    assert actual == [(4, 5)], "masking moved or exposed the ignored span"
+
+
+def test_checker_excludes_components_and_globs(
+    modules: tuple[types.ModuleType, types.ModuleType],
+    tmp_path: Path,
+) -> None:
+    """Exclusions match path components, trailing paths and globs."""
+    rollout, check = modules
+    initialize(
+        tmp_path,
+        {
+            "vendor/lib/notes.md": f"{PROHIBITED}\n",
+            "docs/generated/api.md": f"{PROHIBITED}\n",
+            "docs/guide.txt": f"{PROHIBITED}\n",
+            "docs/guide.md": f"{PROHIBITED}\n",
+        },
+    )
+    policy = rollout.Dictionary(
+        phrase_corrections=((PROHIBITED, "handwritten"),),
+        excluded_files=("vendor", "generated/api.md", "*.txt"),
+    )
+
+    actual = [
+        finding.path for finding in check.check_phrase_corrections(tmp_path, policy)
+    ]
+
+    assert actual == [Path("docs/guide.md")], "path exclusion semantics changed"
+
+
 def test_checker_orders_complete_findings_by_path_phrase_and_source(
     modules: tuple[types.ModuleType, types.ModuleType],
     tmp_path: Path,
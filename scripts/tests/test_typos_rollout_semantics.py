@@ -33,6 +33,30 @@ def test_authority_requires_integer_schema(
         rollout.load_dictionary(authority)
 
 
+def test_identical_dictionary_text_is_parsed_once(
+    rollout_modules: RolloutModules,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Validating then loading the same cache bytes reuses one parse."""
+    _, _, rollout = rollout_modules
+    authority = tmp_path / "base.toml"
+    authority.write_text(dictionary_text("memoiz"), encoding="utf-8")
+    rollout._parse_dictionary.cache_clear()
+    parses: list[str] = []
+    loads = rollout.tomllib.loads
+    monkeypatch.setattr(
+        rollout.tomllib, "loads", lambda text: parses.append(text) or loads(text)
+    )
+
+    rollout._validate_dictionary_bytes(authority.read_bytes())
+    first = rollout.load_dictionary(authority)
+    second = rollout.load_dictionary(authority)
+
+    assert first is second, "identical dictionary text was not reused"
+    assert len(parses) == 1, "identical dictionary text was parsed repeatedly"
+
+
 @pytest.mark.parametrize(
     ("fragment", "message"),
     [
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import dataclasses as dc
+import functools
 import json
 import pathlib
 import tomllib
@@ -104,6 +105,16 @@ def _string_mapping(
 
 def _dictionary_from_text(text: str, *, sparse: bool = False) -> Dictionary:
     """Parse and validate shared dictionary text."""
+    return _parse_dictionary(text, sparse=sparse)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_dictionary(text: str, *, sparse: bool) -> Dictionary:
+    """Parse dictionary text once per distinct content and sparsity.
+
+    One refresh validates the cache bytes and then loads the same text again
+    to render the configuration, so results are memoized by content.
+    """
     document = tomllib.loads(text)
     typos_rollout_policy.validate_document(document, sparse=sparse)
     oxford = _table(document, "oxford")
@@ -267,9 +278,13 @@ def generate_word_mappings(dictionary: Dictionary) -> dict[str, str]:
     return dict(sorted(mappings.items()))
 
 
+# ``json.dumps`` builds a new encoder whenever options differ from the defaults.
+_TOML_STRING_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
 def _toml_string(value: str) -> str:
     """Render a string using TOML-compatible JSON quoting."""
-    return json.dumps(value, ensure_ascii=False)
+    return _TOML_STRING_ENCODER.encode(value)
 
 
 def _render_array(name: str, values: tuple[str, ...]) -> list[str]:
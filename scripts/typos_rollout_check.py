@@ -10,6 +10,8 @@ from __future__ import annotations
 import argparse
 from collections.abc import Sequence
 from dataclasses import dataclass
+import functools
+import glob
 from pathlib import Path
 import re
 import subprocess
@@ -20,6 +22,8 @@ import typos_rollout as rollout
 
 
 POLICY_PATHS = frozenset({Path(".typos-oxendict-base.toml"), Path("typos.local.toml")})
+_NON_NEWLINE = re.compile(r"[^\n]")
+_GLOB_MAGIC = re.compile(r"[*?[]")
 
 
 @dataclass(frozen=True)
@@ -47,6 +51,62 @@ class PhraseFinding:
     correction: str
 
 
+@dataclass(frozen=True)
+class _Exclusions:
+    """Index path exclusions once per check instead of once per file.
+
+    Attributes
+    ----------
+    components
+        Every exclusion entry, matched against individual path components.
+    suffixes
+        Literal path entries, matched against trailing path parts.
+    globs
+        Wildcard or absolute entries compiled into one right-anchored regex
+        with ``Path.match`` semantics, or ``None`` when there are none.
+    """
+
+    components: frozenset[str]
+    suffixes: frozenset[tuple[str, ...]]
+    globs: re.Pattern[str] | None
+
+    @classmethod
+    def from_policy(cls, excluded_files: tuple[str, ...]) -> _Exclusions:
+        """Build the exclusion index for one merged spelling policy."""
+        wildcards = tuple(
+            item
+            for item in excluded_files
+            if _GLOB_MAGIC.search(item) or item.startswith("/")
+        )
+        literals = ((item, Path(item).parts) for item in excluded_files)
+        suffixes = frozenset(
+            parts
+            for item, parts in literals
+            if item not in wildcards and parts != (item,)
+        )
+        return cls(frozenset(excluded_files), suffixes, _compile_globs(wildcards))
+
+    def excludes(self, path: Path) -> bool:
+        """Return whether one tracked path matches any exclusion."""
+        parts = path.parts
+        if not self.components.isdisjoint(parts):
+            return True
+        if any(parts[-len(suffix) :] == suffix for suffix in self.suffixes):
+            return True
+        return self.globs is not None and self.globs.match(path.as_posix()) is not None
+
+
+def _compile_globs(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Combine ``Path.match`` globs into one regex matched from the right."""
+    if not patterns:
+        return None
+    translated = "|".join(
+        glob.translate(Path(item).as_posix(), include_hidden=True, seps="/")
+        for item in patterns
+    )
+    return re.compile(rf"(?s:.*/)?(?:{translated})")
+
+
 def _tracked(repository: Path) -> tuple[Path, ...]:
     """Return tracked paths in deterministic order."""
     raw = subprocess.run(
@@ -58,11 +118,16 @@ def _tracked(repository: Path) -> tuple[Path, ...]:
     return tuple(Path(item) for item in sorted(filter(None, raw.split("\0"))))
 
 
-def _excluded(path: Path, dictionary: rollout.Dictionary) -> bool:
-    """Return whether the spelling policy excludes a tracked path."""
-    return any(
-        item in path.parts or path.match(item) for item in dictionary.excluded_files
-    )
+@functools.lru_cache(maxsize=256)
+def _ignore_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile one ignored-span regex once per process."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def _phrase_pattern(phrase: str) -> re.Pattern[str]:
+    """Compile the token-bounded, case-insensitive regex for one phrase."""
+    return re.compile(rf"(?<![\w-]){re.escape(phrase)}(?![\w-])", re.IGNORECASE)
 
 
 def _masked(text: str, patterns: tuple[str, ...]) -> str:
@@ -70,10 +135,10 @@ def _masked(text: str, patterns: tuple[str, ...]) -> str:
 
     def blank(match: re.Match[str]) -> str:
         """Blank a matched span without changing its line positions."""
-        return "".join("\n" if c == "\n" else " " for c in match.group())
+        return _NON_NEWLINE.sub(" ", match.group())
 
     for pattern in patterns:
-        text = re.sub(pattern, blank, text)
+        text = _ignore_pattern(pattern).sub(blank, text)
     return text
 
 
@@ -86,11 +151,7 @@ def _phrase_findings(
     """Find one prohibited phrase in position-preserving masked text."""
     phrase, correction = policy
     found = []
-    for match in re.finditer(
-        rf"(?<![\w-]){re.escape(phrase)}(?![\w-])",
-        masked,
-        re.IGNORECASE,
-    ):
+    for match in _phrase_pattern(phrase).finditer(masked):
         previous = masked.rfind("\n", 0, match.start())
         found.append(
             PhraseFinding(
@@ -108,9 +169,10 @@ def _file_findings(
     repository: Path,
     relative: Path,
     dictionary: rollout.Dictionary,
+    exclusions: _Exclusions,
 ) -> tuple[PhraseFinding, ...]:
     """Find all prohibited phrases in one eligible tracked UTF-8 file."""
-    if relative in POLICY_PATHS or _excluded(relative, dictionary):
+    if relative in POLICY_PATHS or exclusions.excludes(relative):
         return ()
     try:
         text = (repository / relative).read_text(encoding="utf-8")
@@ -150,10 +212,11 @@ def check_phrase_corrections(
     >>> check_phrase_corrections(Path.cwd(), rollout.Dictionary())
     ()
     """
+    exclusions = _Exclusions.from_policy(dictionary.excluded_files)
     return tuple(
         finding
         for relative in _tracked(repository)
-        for finding in _file_findings(repository, relative, dictionary)
+        for finding in _file_findings(repository, relative, dictionary, exclusions)
     )
 
 
@@ -190,10 +253,12 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
         return 2
     findings = check_phrase_corrections(repository, dictionary)
-    for item in findings:
-        print(
-            f"{item.path}:{item.line}:{item.column}: {item.phrase} -> {item.correction}"
+    sys.stdout.write(
+        "".join(
+            f"{item.path}:{item.line}:{item.column}: {item.phrase} -> {item.correction}\n"
+            for item in findings
         )
+    )
     return 2 if findings else 0
 
 